@@ -1,41 +1,82 @@
+import io
+import json
 import re
 from pathlib import Path
 from docx import Document
+from docx.oxml.ns import qn
 
 WEEK_RE = re.compile(r"\bWEEK\s*(ONE|TWO|THREE|FOUR|FIVE|SIX|SEVEN|EIGHT|NINE|TEN|\d+)\b", re.IGNORECASE)
 
+_SLUG_STRIP_RE = re.compile(r"[^a-z0-9\s_]")
+# Separators left around a topic once the WEEK token is removed
+_STRIP_CHARS = " :-–—\t"
+
 WORD_TO_NUM = {
     "ONE": 1, "TWO": 2, "THREE": 3, "FOUR": 4, "FIVE": 5,
     "SIX": 6, "SEVEN": 7, "EIGHT": 8, "NINE": 9, "TEN": 10
 }
+# Word and digit forms of a week token, so normalize_week is one lookup
+WEEK_MAP = {**WORD_TO_NUM, **{str(i): i for i in range(1, 100)}}
+
+W_P = qn("w:p")
+W_R = qn("w:r")
+W_T = qn("w:t")
+W_BR = qn("w:br")
+# Run children that python-docx renders as characters in Paragraph.text
+RUN_CHARS = {qn("w:tab"): "\t", qn("w:ptab"): "\t", qn("w:cr"): "\n", qn("w:noBreakHyphen"): "-"}
+
+def paragraph_text(p) -> str:
+    """Text of a <w:p> element, read straight from the XML instead of via Paragraph.text"""
+    parts = []
+    for run in p.iter(W_R):
+        for child in run:
+            if child.tag == W_T:
+                parts.append(child.text or "")
+            elif child.tag == W_BR:
+                # Only line breaks count as text; page/column breaks do not
+                if child.get(qn("w:type"), "textWrapping") == "textWrapping":
+                    parts.append("\n")
+            else:
+                parts.append(RUN_CHARS.get(child.tag, ""))
+    return "".join(parts)
+
+def iter_paragraph_lines(doc):
+    """Yield stripped, non-empty text of the body-level paragraphs (same set as doc.paragraphs)"""
+    for p in doc.element.body.iterchildren(W_P):
+        text = paragraph_text(p).strip()
+        if text:
+            yield text
 
 def normalize_week(token: str) -> int:
     token = token.strip().upper()
-    if token.isdigit():
-        return int(token)
-    return WORD_TO_NUM.get(token, -1)
+    # Fall back to int() only for digit forms outside the map (e.g. "01")
+    return WEEK_MAP.get(token) or (int(token) if token.isdigit() else -1)
 
 def slug(s: str) -> str:
     s = s.lower()
-    s = re.sub(r"[^a-z0-9\s_]", "", s)
-    s = re.sub(r"\s+", "_", s).strip("_")
+    s = _SLUG_STRIP_RE.sub("", s)
+    s = "_".join(s.split()).strip("_")
     return s[:80] if s else "unknown"
 
 def extract_weeks_topics(docx_path: Path):
     doc = Document(docx_path)
-    lines = [p.text.strip() for p in doc.paragraphs if p.text and p.text.strip()]
+    lines = list(iter_paragraph_lines(doc))
     results = []
     i = 0
     while i < len(lines):
-        m = WEEK_RE.search(lines[i])
+        line = lines[i]
+        m = WEEK_RE.search(line)
         if not m:
             i += 1
             continue
 
         week_num = normalize_week(m.group(1))
         # Heuristic: topic is usually on same line after WEEK, or in next 1–3 lines
-        topic = lines[i]
-        topic = re.sub(WEEK_RE.pattern, "", topic, flags=re.IGNORECASE).strip(" :-–—\t")
+        # Cut out the match we already have; only rescan the rest of the line for another WEEK token
+        topic = line[:m.start()] + line[m.end():]
+        if WEEK_RE.search(line, m.end()):
+            topic = WEEK_RE.sub("", line)
+        topic = topic.strip(_STRIP_CHARS)
         if not topic:
             # look ahead
             for j in range(i+1, min(i+4, len(lines))):
@@ -62,38 +103,84 @@ def extract_weeks_topics(docx_path: Path):
     clean.sort(key=lambda x: x["week"])
     return clean
 
-def generate_cypher(resource_id: str, title: str, subject: str, term: str, class_level: str, week_topics):
-    cy = []
-    cy.append("CREATE CONSTRAINT resource_id_unique IF NOT EXISTS FOR (r:Resource) REQUIRE r.resource_id IS UNIQUE;")
-    cy.append("CREATE CONSTRAINT week_id_unique IF NOT EXISTS FOR (w:Week) REQUIRE w.week_id IS UNIQUE;")
-    cy.append("CREATE CONSTRAINT concept_id_unique IF NOT EXISTS FOR (c:Concept) REQUIRE c.concept_id IS UNIQUE;")
-    cy.append("CREATE INDEX concept_name_idx IF NOT EXISTS FOR (c:Concept) ON (c.name);")
-    cy.append("")
-    cy.append(f"MERGE (r:Resource {{resource_id: '{resource_id}'}})")
-    cy.append(f"SET r.title = '{title}', r.subject='{subject}', r.term='{term}', r.class='{class_level}';")
-    cy.append("")
-
-    # Weeks + concepts + teaches
+SCHEMA_CYPHER = """\
+CREATE CONSTRAINT resource_id_unique IF NOT EXISTS FOR (r:Resource) REQUIRE r.resource_id IS UNIQUE;
+CREATE CONSTRAINT week_id_unique IF NOT EXISTS FOR (w:Week) REQUIRE w.week_id IS UNIQUE;
+CREATE CONSTRAINT concept_id_unique IF NOT EXISTS FOR (c:Concept) REQUIRE c.concept_id IS UNIQUE;
+CREATE INDEX concept_name_idx IF NOT EXISTS FOR (c:Concept) ON (c.name);
+"""
+
+# Resource, then weeks + concepts + teaches, all weeks in one batch
+LOAD_CYPHER = """\
+MERGE (r:Resource {resource_id: $resource_id})
+SET r.title = $title, r.subject = $subject, r.term = $term, r.class = $class_level;
+
+UNWIND $rows AS row
+MERGE (w:Week {week_id: row.week_id}) SET w.week_number = row.week_number
+WITH row, w
+MATCH (r:Resource {resource_id: $resource_id}) MERGE (r)-[:HAS_WEEK]->(w)
+MERGE (c:Concept {concept_id: row.concept_id})
+SET c.name = row.name, c.subject = $subject, c.term = $term, c.class = $class_level
+MERGE (w)-[:TEACHES]->(c);
+"""
+
+# Prerequisites by week order
+PREREQUISITE_CYPHER = """\
+// Prerequisites inferred from week order
+MATCH (r:Resource {resource_id: $resource_id})-[:HAS_WEEK]->(w1:Week)-[:TEACHES]->(c1:Concept)
+MATCH (r)-[:HAS_WEEK]->(w2:Week)-[:TEACHES]->(c2:Concept)
+WHERE w2.week_number = w1.week_number + 1
+MERGE (c1)-[rel:PREREQUISITE_OF]->(c2)
+SET rel.method='inferred', rel.evidence='Week ordering in scheme of work';"""
+
+def cypher_literal(value) -> str:
+    """Render a Python value as a Cypher literal (used for :param lines)"""
+    if isinstance(value, dict):
+        return "{" + ", ".join(f"{k}: {cypher_literal(v)}" for k, v in value.items()) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ", ".join(cypher_literal(v) for v in value) + "]"
+    # JSON string/number escaping is valid Cypher
+    return json.dumps(value)
+
+def build_params(resource_id: str, title: str, subject: str, term: str, class_level: str, week_topics) -> dict:
+    rows = []
     for wt in week_topics:
         week = wt["week"]
-        topic = wt["topic"].replace("'", "\\'")
-        week_id = f"{resource_id}_w{week}"
-        concept_id = f"{resource_id}_c_{slug(topic)}"
-        cy.append(f"MERGE (w:Week {{week_id:'{week_id}'}}) SET w.week_number={week};")
-        cy.append(f"MATCH (r:Resource {{resource_id:'{resource_id}'}}) MERGE (r)-[:HAS_WEEK]->(w);")
-        cy.append(f"MERGE (c:Concept {{concept_id:'{concept_id}'}})")
-        cy.append(f"SET c.name='{topic}', c.subject='{subject}', c.term='{term}', c.class='{class_level}';")
-        cy.append(f"MERGE (w)-[:TEACHES]->(c);")
-        cy.append("")
-
-    # Prerequisites by week order
-    cy.append("// Prerequisites inferred from week order")
-    cy.append(f"MATCH (r:Resource {{resource_id:'{resource_id}'}})-[:HAS_WEEK]->(w1:Week)-[:TEACHES]->(c1:Concept)")
-    cy.append(f"MATCH (r)-[:HAS_WEEK]->(w2:Week)-[:TEACHES]->(c2:Concept)")
-    cy.append("WHERE w2.week_number = w1.week_number + 1")
-    cy.append("MERGE (c1)-[rel:PREREQUISITE_OF]->(c2)")
-    cy.append("SET rel.method='inferred', rel.evidence='Week ordering in scheme of work';")
-    return "\n".join(cy)
+        topic = wt["topic"]
+        rows.append({
+            "week_id": f"{resource_id}_w{week}",
+            "week_number": week,
+            "concept_id": f"{resource_id}_c_{slug(topic)}",
+            "name": topic,
+        })
+    return {
+        "resource_id": resource_id,
+        "title": title,
+        "subject": subject,
+        "term": term,
+        "class_level": class_level,
+        "rows": rows,
+    }
+
+def write_cypher(fh, resource_id: str, title: str, subject: str, term: str, class_level: str, week_topics):
+    """Stream the Cypher load script to an open text file handle"""
+    params = build_params(resource_id, title, subject, term, class_level, week_topics)
+
+    w = fh.write
+    # Values are passed as parameters, so topics never need quoting/escaping in the statements
+    for name, value in params.items():
+        w(f":param {name} => {cypher_literal(value)}\n")
+    w("\n")
+    w(SCHEMA_CYPHER)
+    w("\n")
+    w(LOAD_CYPHER)
+    w("\n")
+    w(PREREQUISITE_CYPHER)
+
+def generate_cypher(resource_id: str, title: str, subject: str, term: str, class_level: str, week_topics):
+    buf = io.StringIO()
+    write_cypher(buf, resource_id, title, subject, term, class_level, week_topics)
+    return buf.getvalue()
 
 if __name__ == "__main__":
     docx_path = Path("1ST TERM J1 BASIC SCIENCE.docx")  # change if needed
@@ -106,7 +193,7 @@ if __name__ == "__main__":
     term = "First Term"
     class_level = "JSS1"
 
-    cypher = generate_cypher(resource_id, title, subject, term, class_level, week_topics)
     out = Path("basic_science_curriculum_load.cypher")
-    out.write_text(cypher, encoding="utf-8")
+    with out.open("w", encoding="utf-8") as fh:
+        write_cypher(fh, resource_id, title, subject, term, class_level, week_topics)
     print(f"Wrote {out} with {len(week_topics)} weeks/topics extracted.")
\ No newline at end of file
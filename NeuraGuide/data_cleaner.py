@@ -7,30 +7,169 @@ Cleans, deduplicates, and merges data from multiple sources
 import csv
 import json
 import re
-from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain
 import logging
 from urllib.parse import urlparse
 
+import numpy as np
+import pandas as pd
+
+try:
+    import ahocorasick
+except ImportError:
+    # Fall back to plain substring scans if pyahocorasick is not installed
+    ahocorasick = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Precompiled patterns
+_NONWORD_RE = re.compile(r'[^\w\s]')
+_YEAR_RE = re.compile(r'\b(20\d{2})\b')
+
+# Column cleaners used by AIToolsDataCleaner.clean_data. Each one takes a
+# whole string column and returns the cleaned column.
+def _clean_title(col):
+    return col.str.strip().str.title()
+
+def _clean_website(col):
+    return col.str.strip().where(col.str.startswith('http'), "")
+
+def _clean_description(col):
+    return col.str.strip()
+
+def _clean_category(col):
+    return col.str.strip().str.title().where(col != "", "General")
+
+def _clean_pricing(col):
+    pricing = col.str.strip().str.lower()
+    has_free = pricing.str.contains("free", regex=False)
+    conditions = [
+        has_free & pricing.str.contains("trial", regex=False),
+        has_free,
+        pricing.str.contains("subscription|monthly"),
+        pricing.str.contains("pay", regex=False),
+    ]
+    choices = ["Freemium", "Free", "Subscription", "Pay-per-use"]
+    default = col.str.title().where(col != "", "Unknown")
+    return pd.Series(np.select(conditions, choices, default=default), index=col.index)
+
+def _clean_launch_year(col):
+    # Values that already are a plain 20xx year skip the regex
+    is_year = (col.str.len() == 4) & col.str.startswith("20") & col.str.isdigit()
+    if is_year.all():
+        return col
+    # Extract year from the remaining strings
+    extracted = col[~is_year].str.extract(_YEAR_RE, expand=False)
+    return col.where(is_year, extracted).fillna("Unknown")
+
+def _clean_default(col):
+    return col.str.strip().where(col != "", "Unknown")
+
+FIELD_CLEANERS = {
+    "Tool Name": _clean_title,
+    "Website": _clean_website,
+    "Description": _clean_description,
+    "Category": _clean_category,
+    "Primary Function": _clean_title,
+    "Pricing Model": _clean_pricing,
+    "Launch Year": _clean_launch_year,
+}
+
+# Keywords used to categorize tools marked as General, in priority order
+CATEGORY_KEYWORDS = {
+    "Image Generation": ["image", "art", "design", "visual", "photo", "drawing", "midjourney", "dall-e", "stable diffusion", "canva"],
+    "Text Generation": ["text", "writing", "content", "copy", "article", "blog", "chatgpt", "claude", "jasper", "writer"],
+    "Code Assistant": ["code", "programming", "developer", "github", "copilot", "coding", "python", "javascript"],
+    "Video Generation": ["video", "animation", "movie", "film", "motion", "youtube", "tiktok"],
+    "Audio Generation": ["audio", "music", "sound", "voice", "speech", "podcast", "spotify"],
+    "Productivity": ["productivity", "automation", "workflow", "task", "management", "notion", "trello"],
+    "Marketing": ["marketing", "seo", "advertising", "social media", "email", "campaign"],
+    "Data Analysis": ["data", "analytics", "analysis", "insights", "dashboard", "tableau", "power bi"],
+    "Research": ["research", "academic", "paper", "study", "scholar", "science"],
+    "Translation": ["translation", "language", "translate", "multilingual", "google translate"],
+    "Customer Service": ["customer", "support", "chatbot", "help desk", "zendesk"],
+    "Education": ["education", "learning", "teaching", "course", "tutorial", "coursera"],
+    "Health": ["health", "medical", "healthcare", "fitness", "wellness", "hospital"],
+    "Finance": ["finance", "financial", "trading", "investment", "budget", "quickbooks"]
+}
+
+# Default key features, keyed by lowercase category name
+FEATURES_MAP = {
+    "image generation": "AI-powered image creation, Style transfer, High-resolution output",
+    "text generation": "Natural language processing, Content creation, Multiple languages",
+    "code assistant": "Code completion, Syntax highlighting, Multiple programming languages",
+    "video generation": "AI video creation, Template library, Export options",
+    "audio generation": "Music generation, Voice synthesis, Audio editing",
+    "productivity": "Task automation, Workflow optimization, Integration capabilities",
+    "marketing": "Campaign optimization, Analytics, A/B testing",
+    "data analysis": "Data visualization, Predictive analytics, Reporting"
+}
+
+def _merge_longest(old, new):
+    return new if len(new) > len(old) else old
+
+def _merge_key_features(old, new):
+    if new == "See website":
+        return old
+    if old == "See website":
+        return new
+    return f"{old}, {new}"
+
+# How merge_tools combines a non-empty base value with a duplicate's value; other fields keep the base value
+FIELD_POLICY = {
+    "Description": _merge_longest,
+    "Key Features": _merge_key_features
+}
+
+_CATEGORY_NAMES = list(CATEGORY_KEYWORDS)
+
+def _build_category_automaton():
+    """Build one Aho-Corasick automaton mapping every keyword to its category rank"""
+    automaton = ahocorasick.Automaton()
+    for rank, keywords in enumerate(CATEGORY_KEYWORDS.values()):
+        for keyword in keywords:
+            if keyword not in automaton:
+                automaton.add_word(keyword, rank)
+    automaton.make_automaton()
+    return automaton
+
+_CATEGORY_AUTOMATON = _build_category_automaton() if ahocorasick else None
+
+def _match_category(text):
+    """Return the first category (in CATEGORY_KEYWORDS order) with a keyword in text"""
+    if _CATEGORY_AUTOMATON is not None:
+        # One pass over the text finds every keyword; the lowest rank wins
+        rank = min((rank for _, rank in _CATEGORY_AUTOMATON.iter(text)), default=None)
+        return None if rank is None else _CATEGORY_NAMES[rank]
+    
+    for category, keywords in CATEGORY_KEYWORDS.items():
+        if any(keyword in text for keyword in keywords):
+            return category
+    return None
+
 class AIToolsDataCleaner:
     def __init__(self):
+        self.raw_data = pd.DataFrame()
         self.tools_data = []
-        self.seen_names = set()
-        self.seen_domains = set()
         
-    def normalize_text(self, text):
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def normalize_text(text):
         """Normalize text for comparison"""
         if not text:
             return ""
         text = text.lower().strip()
-        text = re.sub(r'[^\w\s]', '', text)  # Remove special characters
-        text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
-        return text
+        text = _NONWORD_RE.sub('', text)  # Remove special characters
+        return ' '.join(text.split())  # Normalize whitespace
     
-    def extract_domain(self, url):
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def extract_domain(url):
         """Extract domain from URL"""
         try:
             parsed = urlparse(url)
@@ -38,54 +177,64 @@ class AIToolsDataCleaner:
         except:
             return ""
     
-    def are_similar_tools(self, tool1, tool2):
-        """Check if two tools are similar"""
-        name1_norm = self.normalize_text(tool1["Tool Name"])
-        name2_norm = self.normalize_text(tool2["Tool Name"])
-        
-        # Exact name match
-        if name1_norm == name2_norm:
-            return True
-        
-        # Check if one name contains the other
-        if name1_norm in name2_norm or name2_norm in name1_norm:
-            return True
-        
-        # Check domain similarity
-        domain1 = self.extract_domain(tool1.get("Website", ""))
-        domain2 = self.extract_domain(tool2.get("Website", ""))
-        
-        if domain1 and domain2 and domain1 == domain2:
-            return True
-        
-        return False
+    def _norm_name(self, tool):
+        """Normalized Tool Name, cached on the tool by clean_data"""
+        if "_norm_name" in tool:
+            return tool["_norm_name"]
+        return self.normalize_text(tool["Tool Name"])
     
-    def merge_tools(self, tools):
-        """Merge similar tools"""
-        if not tools:
+    def _domain(self, tool):
+        """Website domain, cached on the tool by clean_data"""
+        if "_domain" in tool:
+            return tool["_domain"]
+        return self.extract_domain(tool.get("Website", ""))
+    
+    def merge_tools(self, indices, scores):
+        """Merge similar tools, given their indices in tools_data and completeness scores"""
+        if not indices:
             return None
         
         # Use the tool with the most complete data as base
-        best_tool = max(tools, key=lambda t: sum(1 for v in t.values() if v and v != "Unknown"))
+        best_idx = max(indices, key=scores.__getitem__)
+        best_tool = self.tools_data[best_idx]
         
         # Merge data from other tools
-        for tool in tools:
-            if tool == best_tool:
+        for i in indices:
+            tool = self.tools_data[i]
+            # Skip the base tool and exact copies of it
+            if i == best_idx or tool == best_tool:
                 continue
                 
             for field, value in tool.items():
-                if not best_tool.get(field) or best_tool[field] == "Unknown":
-                    best_tool[field] = value
-                elif field == "Description" and len(value) > len(best_tool[field]):
+                old = best_tool.get(field)
+                if not old or old == "Unknown":
                     best_tool[field] = value
-                elif field == "Key Features" and value != "See website":
-                    if best_tool[field] == "See website":
-                        best_tool[field] = value
-                    else:
-                        best_tool[field] = f"{best_tool[field]}, {value}"
+                else:
+                    policy = FIELD_POLICY.get(field)
+                    if policy:
+                        best_tool[field] = policy(old, value)
         
         return best_tool
     
+    @staticmethod
+    def _load_one(filename):
+        """Load a single CSV file, returning None if it cannot be read"""
+        try:
+            # Read every field as a plain string, keeping empty cells as ""
+            frame = pd.read_csv(filename, dtype=str, keep_default_na=False, encoding='utf-8')
+            
+            # Validate required fields
+            frame = frame[frame["Tool Name"] != ""]
+            
+            logger.info(f"Loaded {len(frame)} tools from {filename}")
+            return frame
+            
+        except FileNotFoundError:
+            logger.warning(f"File {filename} not found")
+        except Exception as e:
+            logger.error(f"Error loading {filename}: {e}")
+        return None
+    
     def load_data_from_files(self):
         """Load data from multiple CSV files"""
         files = [
@@ -94,144 +243,157 @@ class AIToolsDataCleaner:
             "advanced_ai_tools.csv"
         ]
         
-        total_loaded = 0
-        
-        for filename in files:
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        # Validate required fields
-                        if not row.get("Tool Name"):
-                            continue
-                        
-                        self.tools_data.append(row)
-                        total_loaded += 1
-                
-                logger.info(f"Loaded {total_loaded} tools from {filename}")
-                
-            except FileNotFoundError:
-                logger.warning(f"File {filename} not found")
-            except Exception as e:
-                logger.error(f"Error loading {filename}: {e}")
+        # Files are read concurrently; results keep the order of `files`
+        with ThreadPoolExecutor(max_workers=len(files)) as executor:
+            frames = [frame for frame in executor.map(self._load_one, files) if frame is not None]
         
-        logger.info(f"Total tools loaded: {len(self.tools_data)}")
+        # Columns a file did not have stay NaN here, so clean_data can tell them from empty cells
+        self.raw_data = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        logger.info(f"Total tools loaded: {len(self.raw_data)}")
     
     def clean_data(self):
         """Clean and standardize data"""
         logger.info("Cleaning data...")
         
-        cleaned_tools = []
-        
-        for tool in self.tools_data:
-            cleaned_tool = {}
-            
-            # Clean and standardize each field
-            for field, value in tool.items():
-                if field == "Tool Name":
-                    cleaned_tool[field] = value.strip().title() if value else ""
-                elif field == "Website":
-                    cleaned_tool[field] = value.strip() if value and value.startswith('http') else ""
-                elif field == "Description":
-                    cleaned_tool[field] = value.strip() if value else ""
-                elif field == "Category":
-                    cleaned_tool[field] = value.strip().title() if value else "General"
-                elif field == "Primary Function":
-                    cleaned_tool[field] = value.strip().title() if value else cleaned_tool.get("Category", "General")
-                elif field == "Pricing Model":
-                    pricing = value.strip().lower() if value else "unknown"
-                    if "free" in pricing and "trial" in pricing:
-                        cleaned_tool[field] = "Freemium"
-                    elif "free" in pricing:
-                        cleaned_tool[field] = "Free"
-                    elif "subscription" in pricing or "monthly" in pricing:
-                        cleaned_tool[field] = "Subscription"
-                    elif "pay" in pricing:
-                        cleaned_tool[field] = "Pay-per-use"
-                    else:
-                        cleaned_tool[field] = value.title() if value else "Unknown"
-                elif field == "Launch Year":
-                    # Extract year from string
-                    year_match = re.search(r'\b(20\d{2})\b', str(value))
-                    cleaned_tool[field] = year_match.group(1) if year_match else "Unknown"
-                else:
-                    cleaned_tool[field] = value.strip() if value else "Unknown"
-            
-            # Validate tool has minimum required data
-            if cleaned_tool.get("Tool Name") and cleaned_tool.get("Tool Name") != "":
-                cleaned_tools.append(cleaned_tool)
-        
-        self.tools_data = cleaned_tools
+        # Cells from columns their source file did not have get no defaults
+        absent = self.raw_data.isna()
+        df = self.raw_data.fillna("")
+        
+        # Clean and standardize each field, one whole column at a time
+        for field in df.columns:
+            df[field] = FIELD_CLEANERS.get(field, _clean_default)(df[field])
+        
+        # Primary Function falls back to the cleaned Category
+        if "Primary Function" in df.columns:
+            fallback = df["Category"] if "Category" in df.columns else "General"
+            df["Primary Function"] = df["Primary Function"].mask(df["Primary Function"] == "", fallback)
+        
+        # Validate tool has minimum required data
+        if "Tool Name" in df.columns:
+            df = df[df["Tool Name"] != ""]
+        
+        # Cache the comparison keys used by deduplication on every tool
+        if "Tool Name" in df.columns:
+            df["_norm_name"] = df["Tool Name"].map(self.normalize_text)
+            df["_domain"] = df["Website"].map(self.extract_domain) if "Website" in df.columns else ""
+        
+        self.tools_data = df.to_dict("records")
+        # Leave those fields off the tool, as if read from its own file (they save as "")
+        absent = absent.loc[df.index]
+        for i in np.flatnonzero(absent.any(axis=1).to_numpy()):
+            tool = self.tools_data[i]
+            for field in absent.columns[absent.iloc[i].to_numpy()]:
+                del tool[field]
         logger.info(f"Cleaned data: {len(self.tools_data)} tools remaining")
     
     def deduplicate_data(self):
         """Remove duplicate tools"""
         logger.info("Deduplicating data...")
         
-        # Group similar tools
-        tool_groups = []
-        processed_indices = set()
-        
-        for i, tool1 in enumerate(self.tools_data):
-            if i in processed_indices:
-                continue
-                
-            similar_tools = [tool1]
-            processed_indices.add(i)
-            
-            for j, tool2 in enumerate(self.tools_data[i+1:], i+1):
-                if j in processed_indices:
-                    continue
-                    
-                if self.are_similar_tools(tool1, tool2):
-                    similar_tools.append(tool2)
-                    processed_indices.add(j)
-            
-            tool_groups.append(similar_tools)
+        n = len(self.tools_data)
+        names = [self._norm_name(tool) for tool in self.tools_data]
+        domains = [self._domain(tool) for tool in self.tools_data]
+        
+        # Union-find over tool indices
+        parent = list(range(n))
+        
+        def find(i):
+            while parent[i] != i:
+                parent[i] = parent[parent[i]]
+                i = parent[i]
+            return i
+        
+        def union(i, j):
+            root_i, root_j = find(i), find(j)
+            if root_i != root_j:
+                # Keep the lowest index as root so groups stay in load order
+                parent[max(root_i, root_j)] = min(root_i, root_j)
+        
+        # Bucket tools by exact normalized name and by domain
+        by_name = defaultdict(list)
+        by_domain = defaultdict(list)
+        for i in range(n):
+            by_name[names[i]].append(i)
+            if domains[i]:
+                by_domain[domains[i]].append(i)
+        
+        for bucket in chain(by_name.values(), by_domain.values()):
+            for j in bucket[1:]:
+                union(bucket[0], j)
+        
+        # Check if one name contains the other, on whole words only:
+        # every word span of a name is looked up in the name buckets
+        for i, name in enumerate(names):
+            words = name.split()
+            for start in range(len(words)):
+                for end in range(start + 1, len(words) + 1):
+                    span = " ".join(words[start:end])
+                    if span != name and span in by_name:
+                        union(i, by_name[span][0])
+        
+        # Group similar tools by index
+        groups = defaultdict(list)
+        for i in range(n):
+            groups[find(i)].append(i)
+        
+        # Completeness score of every tool, computed once
+        scores = [
+            sum(1 for field, v in tool.items() if v and v != "Unknown" and not field.startswith("_"))
+            for tool in self.tools_data
+        ]
         
         # Merge each group
         merged_tools = []
-        for group in tool_groups:
-            merged_tool = self.merge_tools(group)
+        for group in groups.values():
+            merged_tool = self.merge_tools(group, scores)
             if merged_tool:
                 merged_tools.append(merged_tool)
         
         self.tools_data = merged_tools
         logger.info(f"After deduplication: {len(self.tools_data)} unique tools")
     
+    @staticmethod
+    def _categorize_tool(tool):
+        """Recategorize a single tool marked as General; returns True if it changed"""
+        if tool.get("Category") == "General" or tool.get("Primary Function") == "General":
+            text = (tool.get("Tool Name", "") + " " + tool.get("Description", "")).lower()
+            
+            category = _match_category(text)
+            if category:
+                tool["Category"] = category
+                tool["Primary Function"] = category
+                return True
+        return False
+    
+    @staticmethod
+    def _enhance_tool(tool):
+        """Fill category-derived Key Features and Target Users for a single tool"""
+        category = tool.get("Category", "").lower()
+        
+        # Add key features based on category
+        if tool.get("Key Features") == "See website" or not tool.get("Key Features"):
+            features = FEATURES_MAP.get(category)
+            if features:
+                tool["Key Features"] = features
+        
+        # Improve target users based on category
+        if tool.get("Target Users") == "General":
+            if "code" in category or "developer" in category:
+                tool["Target Users"] = "Developers"
+            elif "business" in category or "marketing" in category:
+                tool["Target Users"] = "Business Professionals"
+            elif "education" in category:
+                tool["Target Users"] = "Educators and Students"
+            elif "health" in category:
+                tool["Target Users"] = "Healthcare Professionals"
+            elif "finance" in category:
+                tool["Target Users"] = "Financial Professionals"
+    
     def categorize_uncategorized_tools(self):
         """Categorize tools that are marked as General"""
         logger.info("Categorizing uncategorized tools...")
         
-        categories = {
-            "Image Generation": ["image", "art", "design", "visual", "photo", "drawing", "midjourney", "dall-e", "stable diffusion", "canva"],
-            "Text Generation": ["text", "writing", "content", "copy", "article", "blog", "chatgpt", "claude", "jasper", "writer"],
-            "Code Assistant": ["code", "programming", "developer", "github", "copilot", "coding", "python", "javascript"],
-            "Video Generation": ["video", "animation", "movie", "film", "motion", "youtube", "tiktok"],
-            "Audio Generation": ["audio", "music", "sound", "voice", "speech", "podcast", "spotify"],
-            "Productivity": ["productivity", "automation", "workflow", "task", "management", "notion", "trello"],
-            "Marketing": ["marketing", "seo", "advertising", "social media", "email", "campaign"],
-            "Data Analysis": ["data", "analytics", "analysis", "insights", "dashboard", "tableau", "power bi"],
-            "Research": ["research", "academic", "paper", "study", "scholar", "science"],
-            "Translation": ["translation", "language", "translate", "multilingual", "google translate"],
-            "Customer Service": ["customer", "support", "chatbot", "help desk", "zendesk"],
-            "Education": ["education", "learning", "teaching", "course", "tutorial", "coursera"],
-            "Health": ["health", "medical", "healthcare", "fitness", "wellness", "hospital"],
-            "Finance": ["finance", "financial", "trading", "investment", "budget", "quickbooks"]
-        }
-        
-        categorized_count = 0
-        
-        for tool in self.tools_data:
-            if tool.get("Category") == "General" or tool.get("Primary Function") == "General":
-                text = (tool.get("Tool Name", "") + " " + tool.get("Description", "")).lower()
-                
-                for category, keywords in categories.items():
-                    if any(keyword in text for keyword in keywords):
-                        tool["Category"] = category
-                        tool["Primary Function"] = category
-                        categorized_count += 1
-                        break
+        categorized_count = sum(self._categorize_tool(tool) for tool in self.tools_data)
         
         logger.info(f"Recategorized {categorized_count} tools")
     
@@ -240,80 +402,54 @@ class AIToolsDataCleaner:
         logger.info("Enhancing data...")
         
         for tool in self.tools_data:
-            # Add key features based on category
-            if tool.get("Key Features") == "See website" or not tool.get("Key Features"):
-                category = tool.get("Category", "").lower()
-                
-                features_map = {
-                    "image generation": "AI-powered image creation, Style transfer, High-resolution output",
-                    "text generation": "Natural language processing, Content creation, Multiple languages",
-                    "code assistant": "Code completion, Syntax highlighting, Multiple programming languages",
-                    "video generation": "AI video creation, Template library, Export options",
-                    "audio generation": "Music generation, Voice synthesis, Audio editing",
-                    "productivity": "Task automation, Workflow optimization, Integration capabilities",
-                    "marketing": "Campaign optimization, Analytics, A/B testing",
-                    "data analysis": "Data visualization, Predictive analytics, Reporting"
-                }
-                
-                for cat, features in features_map.items():
-                    if cat in category:
-                        tool["Key Features"] = features
-                        break
-            
-            # Improve target users based on category
-            if tool.get("Target Users") == "General":
-                category = tool.get("Category", "").lower()
-                
-                if "code" in category or "developer" in category:
-                    tool["Target Users"] = "Developers"
-                elif "business" in category or "marketing" in category:
-                    tool["Target Users"] = "Business Professionals"
-                elif "education" in category:
-                    tool["Target Users"] = "Educators and Students"
-                elif "health" in category:
-                    tool["Target Users"] = "Healthcare Professionals"
-                elif "finance" in category:
-                    tool["Target Users"] = "Financial Professionals"
+            self._enhance_tool(tool)
+    
+    def enrich(self):
+        """Categorize and enhance every tool in a single pass"""
+        logger.info("Categorizing and enhancing tools...")
+        
+        categorized_count = 0
+        
+        for tool in self.tools_data:
+            categorized_count += self._categorize_tool(tool)
+            # Features/target users use the category just assigned above
+            self._enhance_tool(tool)
+        
+        logger.info(f"Recategorized {categorized_count} tools")
     
     def save_cleaned_data(self, filename="final_ai_tools_database.csv"):
         """Save cleaned data to CSV"""
         fieldnames = ["Tool Name", "Category", "Primary Function", "Description", "Website", 
                      "Pricing Model", "Key Features", "Target Users", "Launch Year", "Company"]
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.tools_data)
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            # Project each tool onto the output fields; private fields such as _norm_name are not written
+            writer.writerows([tool.get(field, "") for field in fieldnames] for tool in self.tools_data)
         
         logger.info(f"Saved {len(self.tools_data)} cleaned tools to {filename}")
     
     def generate_statistics(self):
         """Generate statistics about the cleaned dataset"""
+        tools = self.tools_data
+        years = (tool.get("Launch Year", "Unknown") for tool in tools)
         stats = {
-            "total_tools": len(self.tools_data),
-            "categories": defaultdict(int),
-            "pricing_models": defaultdict(int),
-            "target_users": defaultdict(int),
-            "launch_years": defaultdict(int)
+            "total_tools": len(tools),
+            "categories": Counter(tool.get("Category", "Unknown") for tool in tools),
+            "pricing_models": Counter(tool.get("Pricing Model", "Unknown") for tool in tools),
+            "target_users": Counter(tool.get("Target Users", "Unknown") for tool in tools),
+            "launch_years": Counter(year for year in years if year != "Unknown")
         }
         
-        for tool in self.tools_data:
-            stats["categories"][tool.get("Category", "Unknown")] += 1
-            stats["pricing_models"][tool.get("Pricing Model", "Unknown")] += 1
-            stats["target_users"][tool.get("Target Users", "Unknown")] += 1
-            
-            year = tool.get("Launch Year", "Unknown")
-            if year != "Unknown":
-                stats["launch_years"][year] += 1
-        
         logger.info("Dataset Statistics:")
         logger.info(f"Total Tools: {stats['total_tools']}")
         logger.info("Top Categories:")
-        for cat, count in sorted(stats["categories"].items(), key=lambda x: x[1], reverse=True)[:10]:
+        for cat, count in stats["categories"].most_common(10):
             logger.info(f"  {cat}: {count}")
         
         logger.info("Pricing Models:")
-        for model, count in sorted(stats["pricing_models"].items(), key=lambda x: x[1], reverse=True):
+        for model, count in stats["pricing_models"].most_common():
             logger.info(f"  {model}: {count}")
         
         return stats
@@ -331,11 +467,8 @@ class AIToolsDataCleaner:
         # Remove duplicates
         self.deduplicate_data()
         
-        # Categorize uncategorized tools
-        self.categorize_uncategorized_tools()
-        
-        # Enhance data
-        self.enhance_data()
+        # Categorize uncategorized tools and enhance data
+        self.enrich()
         
         # Generate statistics
         stats = self.generate_statistics()
@@ -5,9 +5,15 @@ A modular pipeline for cleaning and preprocessing CSV data
 
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 from datetime import datetime
+import functools
+import os
 import re
 import logging
+import warnings
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 # Set up logging
 logging.basicConfig(
@@ -16,6 +22,57 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Above this many float columns with gaps, handle_missing_values fills them as one NumPy block
+WIDE_FRAME_COLUMNS = 32
+
+# snake_case conversion patterns used by rename_columns
+_CAMEL_RE = re.compile(r'(?<!^)(?=[A-Z])')
+_NON_SNAKE_RE = re.compile(r'[^a-z0-9_]')
+_UNDERSCORES_RE = re.compile(r'_+')
+
+# remove_special pattern for Arrow's RE2 engine; the extra classes make \s match what Python's \s does
+_SPECIAL_CHARS_RE2 = r'[^a-zA-Z0-9\s\p{Z}\x0b\x1c-\x1f\x85]'
+
+
+def _requires_df(method):
+    """Skip a pipeline step (with a warning) until data has been loaded."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.df is None:
+            logger.warning(f"No data loaded yet ({method.__name__} skipped).")
+            return
+        return method(self, *args, **kwargs)
+    return wrapper
+
+
+def _map_column_chunks(func, values):
+    """Apply func to blocks of columns of a 2D array on a thread pool; results joined along the last axis."""
+    chunks = np.array_split(np.arange(values.shape[1]), os.cpu_count() or 1)
+    # NumPy's partial sorts release the GIL, so the blocks are processed in parallel
+    with ThreadPoolExecutor() as executor:
+        return np.concatenate(list(executor.map(lambda cols: func(values[:, cols]), chunks)), axis=-1)
+
+
+def _fill_with_median(values):
+    """Replace NaNs in a 2D float array with their column medians, columns split across threads."""
+    # Column-major copy so each column's values are contiguous for the partial sort
+    values = np.asfortranarray(values)
+    # All-NaN columns get a NaN median (left unfilled, like Series.median) without the warning
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        medians = _map_column_chunks(lambda block: np.nanmedian(block, axis=0), values)
+    return np.where(np.isnan(values), medians, values)
+
+
+def _column_quartiles(values):
+    """Q1 and Q3 of each column of a 2D float array (NaNs skipped), columns split across threads."""
+    if values.shape[1] == 0:
+        return np.empty((2, 0))
+    values = np.asfortranarray(values)
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', RuntimeWarning)
+        return _map_column_chunks(lambda block: np.nanquantile(block, [0.25, 0.75], axis=0), values)
+
 
 class DataCleaningPipeline:
     """
@@ -34,37 +91,91 @@ class DataCleaningPipeline:
         self.original_shape = None
         self.cleaning_report = {}
         
-    def load_data(self, **kwargs):
+    def load_data(self, columns=None, categorical_cols=None, chunksize=None, dedupe_chunks=False, **kwargs):
         """
-        Load CSV data into a pandas DataFrame.
+        Load CSV (or .parquet) data into a pandas DataFrame.
         
         Args:
+            columns (list): Only parse these columns (all columns if None)
+            categorical_cols (list): Low-cardinality text columns to load as 'category'
+            chunksize (int): Parse the CSV this many rows at a time and concatenate once at the end
+            dedupe_chunks (bool): Drop exact duplicate rows within each chunk as it is read
+                                  (remove_duplicates still handles duplicates across chunks)
             **kwargs: Additional arguments to pass to pd.read_csv()
+                      (dtype_backend='pyarrow' also switches to the pyarrow parser unless chunksize is set)
         """
         logger.info(f"Loading data from {self.filepath}")
+        if columns is not None:
+            # Columns the later steps never use are skipped by the parser instead of loaded and dropped
+            kwargs.setdefault('usecols', columns)
+        if categorical_cols:
+            categories = {col: 'category' for col in categorical_cols}
+            dtype = kwargs.get('dtype')
+            if isinstance(dtype, dict):
+                kwargs['dtype'] = {**categories, **dtype}
+            elif dtype is not None:
+                # A single dtype (e.g. dtype=str) still applies to every other column; spelled out
+                # from the header because the pyarrow parser ignores a defaultdict's default
+                header_kwargs = {k: v for k, v in kwargs.items() if k not in ('dtype', 'engine')}
+                header = pd.read_csv(self.filepath, nrows=0, **header_kwargs).columns
+                kwargs['dtype'] = {**dict.fromkeys(header, dtype), **categories}
+            else:
+                kwargs['dtype'] = categories
+        if kwargs.get('dtype_backend') == 'pyarrow' and not chunksize:
+            # The pyarrow parser cannot read in chunks
+            kwargs.setdefault('engine', 'pyarrow')
         try:
-            self.df = pd.read_csv(self.filepath, **kwargs)
-            self.original_shape = self.df.shape
+            if str(self.filepath).endswith('.parquet'):
+                # Parquet carries its own schema, so only the column selection applies
+                self.df = pd.read_parquet(self.filepath, columns=columns)
+            elif chunksize:
+                self.df, rows_read = self._read_csv_chunks(chunksize, dedupe_chunks, **kwargs)
+                if categorical_cols:
+                    # Chunks with different categories concatenate to object; restore the dtype
+                    self.df = self.df.astype({col: 'category' for col in categorical_cols if col in self.df.columns})
+            else:
+                self.df = pd.read_csv(self.filepath, **kwargs)
+            if not chunksize or str(self.filepath).endswith('.parquet'):
+                rows_read = self.df.shape[0]
+            self.original_shape = (rows_read, self.df.shape[1])
             logger.info(f"Data loaded successfully. Shape: {self.df.shape}")
-            self.cleaning_report['original_rows'] = self.df.shape[0]
+            self.cleaning_report['original_rows'] = rows_read
             self.cleaning_report['original_columns'] = self.df.shape[1]
         except Exception as e:
             logger.error(f"Error loading data: {e}")
             raise
             
+    def _read_csv_chunks(self, chunksize, dedupe_chunks, **kwargs):
+        """Read the CSV in chunks; returns the concatenated frame and the number of rows read."""
+        parts = []
+        rows_read = 0
+        for chunk in pd.read_csv(self.filepath, chunksize=chunksize, **kwargs):
+            rows_read += len(chunk)
+            if dedupe_chunks:
+                chunk = chunk.drop_duplicates()
+            parts.append(chunk)
+        if dedupe_chunks:
+            self.cleaning_report['duplicates_dropped_on_load'] = rows_read - sum(map(len, parts))
+        return pd.concat(parts), rows_read
+        
+    @_requires_df
     def display_info(self):
         """Display basic information about the dataset."""
-        if self.df is None:
-            logger.warning("No data loaded yet.")
+        # The scans and reprs below are only worth doing if INFO is actually logged
+        if not logger.isEnabledFor(logging.INFO):
             return
             
-        logger.info("\n=== Dataset Information ===")
-        logger.info(f"Shape: {self.df.shape}")
-        logger.info(f"Columns: {list(self.df.columns)}")
-        logger.info(f"\nData Types:\n{self.df.dtypes}")
-        logger.info(f"\nMissing Values:\n{self.df.isnull().sum()}")
-        logger.info(f"\nDuplicate Rows: {self.df.duplicated().sum()}")
+        info = [
+            "\n=== Dataset Information ===",
+            f"Shape: {self.df.shape}",
+            f"Columns: {list(self.df.columns)}",
+            f"\nData Types:\n{self.df.dtypes}",
+            f"\nMissing Values:\n{self.df.isnull().sum()}",
+            f"\nDuplicate Rows: {self.df.duplicated().sum()}"
+        ]
+        logger.info("\n".join(info))
         
+    @_requires_df
     def remove_duplicates(self, subset=None, keep='first'):
         """
         Remove duplicate rows.
@@ -73,10 +184,6 @@ class DataCleaningPipeline:
             subset (list): Column names to consider for duplicates
             keep (str): Which duplicates to keep ('first', 'last', or False)
         """
-        if self.df is None:
-            logger.warning("No data loaded yet.")
-            return
-            
         initial_rows = len(self.df)
         self.df = self.df.drop_duplicates(subset=subset, keep=keep)
         rows_removed = initial_rows - len(self.df)
@@ -84,6 +191,7 @@ class DataCleaningPipeline:
         logger.info(f"Removed {rows_removed} duplicate rows")
         self.cleaning_report['duplicates_removed'] = rows_removed
         
+    @_requires_df
     def handle_missing_values(self, strategy='auto', fill_value=None, columns=None):
         """
         Handle missing values with various strategies.
@@ -93,11 +201,8 @@ class DataCleaningPipeline:
             fill_value: Value to use for filling (if strategy is 'fill')
             columns (list): Specific columns to apply strategy to
         """
-        if self.df is None:
-            logger.warning("No data loaded yet.")
-            return
-            
-        missing_before = self.df.isnull().sum().sum()
+        missing_per_column = self.df.isnull().sum()
+        missing_before = missing_per_column.sum()
         
         if columns is None:
             columns = self.df.columns
@@ -111,28 +216,40 @@ class DataCleaningPipeline:
             logger.info(f"Filled missing values with {fill_value}")
             
         elif strategy == 'ffill':
-            self.df[columns] = self.df[columns].fillna(method='ffill')
+            self.df[columns] = self.df[columns].ffill()
             logger.info(f"Forward filled missing values")
             
         elif strategy == 'bfill':
-            self.df[columns] = self.df[columns].fillna(method='bfill')
+            self.df[columns] = self.df[columns].bfill()
             logger.info(f"Backward filled missing values")
             
         elif strategy == 'auto':
-            for col in columns:
-                if self.df[col].dtype in ['int64', 'float64']:
-                    # Fill numeric columns with median
-                    self.df[col].fillna(self.df[col].median(), inplace=True)
-                else:
-                    # Fill categorical columns with mode
-                    mode_value = self.df[col].mode()
-                    if len(mode_value) > 0:
-                        self.df[col].fillna(mode_value[0], inplace=True)
+            # Only columns that actually have gaps need a median/mode
+            columns = [col for col in columns if missing_per_column[col] > 0]
+            # Only plain int64/float64 columns take the median; other dtypes (nullable Int64,
+            # int64[pyarrow], ...) could not hold a fractional median, so they use the mode
+            numeric_cols = [col for col in columns if self.df[col].dtype in ['int64', 'float64']]
+            categorical_cols = [col for col in columns if col not in numeric_cols]
+            
+            float_cols = [col for col in numeric_cols if self.df[col].dtype == np.float64]
+            if len(float_cols) > WIDE_FRAME_COLUMNS:
+                # Wide float tables: medians in parallel column chunks, then one 2D fill
+                self.df[float_cols] = _fill_with_median(self.df[float_cols].to_numpy())
+                numeric_cols = [col for col in numeric_cols if col not in float_cols]
+                
+            # Fill numeric columns with median, categorical columns with mode, in one fillna call
+            fill_map = self.df[numeric_cols].median().to_dict()
+            if categorical_cols:
+                modes = self.df[categorical_cols].mode()
+                if len(modes) > 0:
+                    fill_map.update(modes.iloc[0].to_dict())
+            self.df = self.df.fillna(value=fill_map)
             logger.info(f"Auto-filled missing values (median for numeric, mode for categorical)")
         
         missing_after = self.df.isnull().sum().sum()
         self.cleaning_report['missing_values_handled'] = missing_before - missing_after
         
+    @_requires_df
     def remove_outliers(self, columns=None, method='iqr', threshold=1.5):
         """
         Remove outliers from numeric columns.
@@ -142,32 +259,32 @@ class DataCleaningPipeline:
             method (str): 'iqr' or 'zscore'
             threshold (float): IQR multiplier or z-score threshold
         """
-        if self.df is None:
-            logger.warning("No data loaded yet.")
-            return
-            
         initial_rows = len(self.df)
         
         if columns is None:
             columns = self.df.select_dtypes(include=[np.number]).columns.tolist()
             
-        for col in columns:
-            if method == 'iqr':
-                Q1 = self.df[col].quantile(0.25)
-                Q3 = self.df[col].quantile(0.75)
-                IQR = Q3 - Q1
-                lower_bound = Q1 - threshold * IQR
-                upper_bound = Q3 + threshold * IQR
-                self.df = self.df[(self.df[col] >= lower_bound) & (self.df[col] <= upper_bound)]
-                
-            elif method == 'zscore':
-                z_scores = np.abs((self.df[col] - self.df[col].mean()) / self.df[col].std())
-                self.df = self.df[z_scores < threshold]
+        # Bounds for every column come from the same (unfiltered) data, then rows are filtered once
+        values = self.df[columns].to_numpy(dtype=float)
+        if method == 'iqr':
+            # Quartiles from the array already extracted, instead of a second pass through DataFrame.quantile
+            Q1, Q3 = _column_quartiles(values)
+            IQR = Q3 - Q1
+            lower_bound = Q1 - threshold * IQR
+            upper_bound = Q3 + threshold * IQR
+            self.df = self.df[((values >= lower_bound) & (values <= upper_bound)).all(axis=1)]
+            
+        elif method == 'zscore':
+            mean = self.df[columns].mean().to_numpy(dtype=float)
+            std = self.df[columns].std().to_numpy(dtype=float)
+            z_scores = np.abs((values - mean) / std)
+            self.df = self.df[(z_scores < threshold).all(axis=1)]
         
         rows_removed = initial_rows - len(self.df)
         logger.info(f"Removed {rows_removed} outlier rows using {method} method")
         self.cleaning_report['outliers_removed'] = rows_removed
         
+    @_requires_df
     def standardize_text(self, columns=None, lowercase=True, strip=True, remove_special=False):
         """
         Standardize text columns.
@@ -178,24 +295,45 @@ class DataCleaningPipeline:
             strip (bool): Remove leading/trailing whitespace
             remove_special (bool): Remove special characters
         """
-        if self.df is None:
-            logger.warning("No data loaded yet.")
-            return
-            
         if columns is None:
-            columns = self.df.select_dtypes(include=['object']).columns.tolist()
+            columns = self.df.select_dtypes(include=['object', 'string', 'category']).columns.tolist()
             
-        for col in columns:
+        def transform(values):
+            # Run the string ops with Arrow compute kernels on one contiguous array
+            try:
+                arr = pa.array(values, type=pa.string(), from_pandas=True)
+            except (pa.ArrowInvalid, pa.ArrowTypeError):
+                arr = None
+            if arr is None or arr.null_count:
+                # Non-string and missing values are converted like astype(str) ('nan', '1.0')
+                arr = pa.array(values.astype(str), type=pa.string())
             if strip:
-                self.df[col] = self.df[col].astype(str).str.strip()
+                arr = pc.utf8_trim_whitespace(arr)
             if lowercase:
-                self.df[col] = self.df[col].astype(str).str.lower()
+                arr = pc.utf8_lower(arr)
             if remove_special:
-                self.df[col] = self.df[col].astype(str).str.replace(r'[^a-zA-Z0-9\s]', '', regex=True)
+                arr = pc.replace_substring_regex(arr, _SPECIAL_CHARS_RE2, '')
+            return arr
+            
+        for col in columns:
+            if not (strip or lowercase or remove_special):
+                break
+            values = self.df[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Only the distinct values need the string ops; the codes are remapped, and
+                # categories that become equal (e.g. 'A ' and 'a') are merged
+                new_categories = transform(pd.Series(values.cat.categories)).to_pandas()
+                remap, categories = pd.factorize(new_categories)
+                codes = values.cat.codes.to_numpy()
+                new_codes = np.where(codes >= 0, remap[codes] if len(remap) else -1, -1)
+                self.df[col] = pd.Categorical.from_codes(new_codes, categories=categories)
+            else:
+                self.df[col] = pd.Series(pd.array(transform(values), dtype='string[pyarrow]'), index=self.df.index)
                 
         logger.info(f"Standardized text columns: {columns}")
         self.cleaning_report['text_columns_standardized'] = len(columns)
         
+    @_requires_df
     def convert_data_types(self, type_dict):
         """
         Convert column data types.
@@ -204,10 +342,6 @@ class DataCleaningPipeline:
             type_dict (dict): Dictionary mapping column names to data types
                              Example: {'age': 'int', 'price': 'float', 'date': 'datetime'}
         """
-        if self.df is None:
-            logger.warning("No data loaded yet.")
-            return
-            
         for col, dtype in type_dict.items():
             try:
                 if dtype == 'datetime':
@@ -220,6 +354,7 @@ class DataCleaningPipeline:
                 
         self.cleaning_report['columns_type_converted'] = len(type_dict)
         
+    @_requires_df
     def rename_columns(self, rename_dict=None, snake_case=False):
         """
         Rename columns.
@@ -228,25 +363,22 @@ class DataCleaningPipeline:
             rename_dict (dict): Dictionary mapping old names to new names
             snake_case (bool): Convert all column names to snake_case
         """
-        if self.df is None:
-            logger.warning("No data loaded yet.")
-            return
-            
         if rename_dict:
             self.df.rename(columns=rename_dict, inplace=True)
             logger.info(f"Renamed columns: {rename_dict}")
             
         if snake_case:
-            new_columns = {}
-            for col in self.df.columns:
-                # Convert to snake_case
-                snake = re.sub(r'(?<!^)(?=[A-Z])', '_', col).lower()
-                snake = re.sub(r'[^a-z0-9_]', '_', snake)
-                snake = re.sub(r'_+', '_', snake).strip('_')
-                new_columns[col] = snake
-            self.df.rename(columns=new_columns, inplace=True)
+            # Convert all names to snake_case in one pass over the column Index
+            snake = (self.df.columns.astype(str)
+                     .str.replace(_CAMEL_RE, '_', regex=True)
+                     .str.lower()
+                     .str.replace(_NON_SNAKE_RE, '_', regex=True)
+                     .str.replace(_UNDERSCORES_RE, '_', regex=True)
+                     .str.strip('_'))
+            self.df.rename(columns=dict(zip(self.df.columns, snake)), inplace=True)
             logger.info(f"Converted column names to snake_case")
             
+    @_requires_df
     def remove_columns(self, columns):
         """
         Remove specified columns.
@@ -254,39 +386,47 @@ class DataCleaningPipeline:
         Args:
             columns (list): List of column names to remove
         """
-        if self.df is None:
-            logger.warning("No data loaded yet.")
-            return
-            
         existing_cols = [col for col in columns if col in self.df.columns]
         self.df = self.df.drop(columns=existing_cols)
         logger.info(f"Removed columns: {existing_cols}")
         self.cleaning_report['columns_removed'] = len(existing_cols)
         
+    @_requires_df
+    def downcast_numeric(self):
+        """Downcast numeric columns to the smallest integer/float dtype that holds their values."""
+        memory_before = self.df.memory_usage(deep=True).sum()
+        for col in self.df.select_dtypes(include='integer').columns:
+            self.df[col] = pd.to_numeric(self.df[col], downcast='integer')
+        for col in self.df.select_dtypes(include='floating').columns:
+            self.df[col] = pd.to_numeric(self.df[col], downcast='float')
+        memory_after = self.df.memory_usage(deep=True).sum()
+        
+        logger.info(f"Downcast numeric columns: {memory_before} -> {memory_after} bytes")
+        self.cleaning_report['bytes_saved_by_downcast'] = memory_before - memory_after
+        
+    @_requires_df
     def reset_index(self):
         """Reset the DataFrame index."""
-        if self.df is None:
-            logger.warning("No data loaded yet.")
-            return
-            
         self.df.reset_index(drop=True, inplace=True)
         logger.info("Reset index")
         
+    @_requires_df
     def save_cleaned_data(self, output_path, index=False, **kwargs):
         """
-        Save cleaned data to CSV.
+        Save cleaned data to CSV, or to Parquet when output_path ends with .parquet.
         
         Args:
-            output_path (str): Path for output CSV file
+            output_path (str): Path for output CSV/Parquet file
             index (bool): Whether to write row indices
-            **kwargs: Additional arguments to pass to to_csv()
+            **kwargs: Additional arguments to pass to to_csv() / to_parquet()
         """
-        if self.df is None:
-            logger.warning("No data loaded yet.")
-            return
-            
         try:
-            self.df.to_csv(output_path, index=index, **kwargs)
+            if str(output_path).endswith('.parquet'):
+                # Typed, compressed columns: smaller than CSV and reloads without parsing
+                kwargs.setdefault('compression', 'zstd')
+                self.df.to_parquet(output_path, engine='pyarrow', index=index, **kwargs)
+            else:
+                self.df.to_csv(output_path, index=index, **kwargs)
             logger.info(f"Cleaned data saved to {output_path}")
             logger.info(f"Final shape: {self.df.shape}")
             self.cleaning_report['final_rows'] = self.df.shape[0]
@@ -297,16 +437,55 @@ class DataCleaningPipeline:
             
     def generate_report(self):
         """Generate and display cleaning report."""
-        logger.info("\n=== Data Cleaning Report ===")
-        for key, value in self.cleaning_report.items():
-            logger.info(f"{key}: {value}")
+        if not logger.isEnabledFor(logging.INFO):
+            return self.cleaning_report
+            
+        report = ["\n=== Data Cleaning Report ==="]
+        report.extend(f"{key}: {value}" for key, value in self.cleaning_report.items())
         
         if 'original_rows' in self.cleaning_report and 'final_rows' in self.cleaning_report:
             rows_change = self.cleaning_report['original_rows'] - self.cleaning_report['final_rows']
             pct_change = (rows_change / self.cleaning_report['original_rows']) * 100
-            logger.info(f"\nTotal rows removed: {rows_change} ({pct_change:.2f}%)")
+            report.append(f"\nTotal rows removed: {rows_change} ({pct_change:.2f}%)")
             
+        logger.info("\n".join(report))
         return self.cleaning_report
+        
+    @classmethod
+    def run_many(cls, filepaths, output_dir='.', max_workers=None):
+        """
+        Clean several CSV files in parallel, one worker process per file.
+        
+        Each file goes through the default steps (duplicates, missing values,
+        text, outliers) and is saved as cleaned_<filename> in output_dir.
+        
+        Args:
+            filepaths (list): Paths of the CSV files to clean
+            output_dir (str): Directory for the cleaned files
+            max_workers (int): Number of worker processes (defaults to the CPU count)
+            
+        Returns:
+            dict: Cleaning report of each file, keyed by its path
+        """
+        jobs = [(cls, filepath, os.path.join(output_dir, f"cleaned_{os.path.basename(filepath)}"))
+                for filepath in filepaths]
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            reports = list(executor.map(_run_default_steps, jobs))
+        return dict(zip(filepaths, reports))
+
+
+def _run_default_steps(job):
+    """Run the default cleaning steps on one file (worker for run_many)."""
+    cls, filepath, output_path = job
+    pipeline = cls(filepath)
+    pipeline.load_data()
+    pipeline.remove_duplicates()
+    pipeline.handle_missing_values(strategy='auto')
+    pipeline.standardize_text(lowercase=True, strip=True)
+    pipeline.remove_outliers(method='iqr', threshold=1.5)
+    pipeline.reset_index()
+    pipeline.save_cleaned_data(output_path)
+    return pipeline.cleaning_report
 
 
 # Example usage
@@ -7,8 +7,10 @@ import random
 
 import re
 from urllib.parse import urlparse
+from collections import OrderedDict
 
 import logging
+import warnings
 
 random.seed(42)
 
@@ -17,6 +19,10 @@ print("Libraries imported!")
 
 pd.options.display.float_format = "{:.2f}".format
 
+# Copy-on-Write: handlers can share the caller's frame instead of copying it up front;
+# pandas only copies data when one side is actually modified
+pd.set_option("mode.copy_on_write", True)
+
 # Set up logging
 logging.basicConfig(
     level=logging.INFO,
@@ -25,13 +31,151 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-
-def load_data(path:str):
-    """Loads the dataset"""
+# URL patterns compiled once at import; the optional scheme stands in for prepending 'http://'
+_URL_SCHEME_RE = re.compile(r'^https?://', re.IGNORECASE)
+_URL_RE = re.compile(
+    r'^(?:https?://)?'
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
+    r'localhost|'
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+    r'(?::\d+)?'
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
+
+# Column types of the AI tools CSV, so the parser does not have to infer them
+# ('Launch Year' stays text: it holds values such as "Unknown")
+AI_TOOLS_DTYPES = {
+    'Tool Name': object, 'Category': object, 'Primary Function': object, 'Description': object,
+    'Website': object, 'Pricing Model': object, 'Key Features': object, 'Target Users': object,
+    'Launch Year': object, 'Company': object, 'category_rank': 'int64', 'ID': 'int64',
+    'Category_code': 'int64', 'average_rating': 'float64', 'review_count': 'int64',
+}
+
+
+# Strings pandas' read_csv treats as missing by default; the Arrow reader is given the same set
+NA_VALUES = ['', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+             '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null']
+
+
+def read_csv_arrow(path, usecols=None, block_size=1 << 22):
+    """Parse a CSV with pyarrow's multithreaded reader into Arrow-backed pandas columns"""
+    from pyarrow import csv as pacsv
+    table = pacsv.read_csv(
+        path,
+        read_options=pacsv.ReadOptions(use_threads=True, block_size=block_size),
+        convert_options=pacsv.ConvertOptions(include_columns=usecols, null_values=NA_VALUES,
+                                             strings_can_be_null=True))
+    # self_destruct frees each Arrow column as pandas takes it over, so peak memory is ~1x the data
+    return table.to_pandas(types_mapper=pd.ArrowDtype, self_destruct=True, split_blocks=True)
+
+
+# Host -> reachable, shared across check_reachability calls; least recently used hosts are evicted
+_HOST_REACHABILITY = OrderedDict()
+_HOST_CACHE_SIZE = 4096
+
+# Whitespace run for Arrow's RE2 engine; the extra classes make \s match what Python's \s does
+_WHITESPACE_RE2 = r'[\s\p{Z}\x0b\x1c-\x1f\x85]+'
+
+
+def read_csv_cached(path):
+    """
+    Parse a CSV once and keep the result as '<path>.parquet' next to it; later calls read
+    the parquet file instead, until the CSV's size or modification time changes
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    cache_path = path + '.parquet'
+    stat = os.stat(path)
+    # Recorded in the parquet metadata: an exact match, so an older CSV copied over this one is noticed too
+    source = f"{stat.st_size}:{stat.st_mtime_ns}".encode()
+    if os.path.exists(cache_path) and (pq.read_schema(cache_path).metadata or {}).get(b'source_csv') == source:
+        data = pd.read_parquet(cache_path, engine='pyarrow')
+        # Parquet gives None for missing text; read_csv gives NaN
+        text_cols = data.select_dtypes(include='object').columns
+        data[text_cols] = data[text_cols].where(data[text_cols].notna(), np.nan)
+        return data
     data = pd.read_csv(path)
+    try:
+        table = pa.Table.from_pandas(data, preserve_index=False)
+        table = table.replace_schema_metadata({**table.schema.metadata, b'source_csv': source})
+        pq.write_table(table, cache_path, compression='zstd')
+    except (OSError, ValueError, TypeError, pa.ArrowException) as e:
+        # Not fatal: e.g. read-only directory or a column pyarrow cannot store
+        logger.warning(f"Could not write parquet cache {cache_path}: {e}")
+    return data
+
+
+def load_data(path:str, categorical_cols=None, dtype_backend=None, downcast=False,
+              chunksize=None, dtypes=None, usecols=None, cache=False):
+    """
+    Loads the dataset
+    categorical_cols: low-cardinality text columns to load as 'category'
+    dtype_backend: 'pyarrow' for Arrow-backed columns (parsed by pyarrow's multithreaded CSV reader)
+    downcast: shrink numeric columns to the smallest dtype that fits
+    chunksize: return an iterator of DataFrames with this many rows each instead of one frame
+    dtypes: column -> dtype hints (e.g. AI_TOOLS_DTYPES); skips type inference for those columns
+    usecols: only parse these columns
+    cache: reuse a parquet copy of the parsed CSV (see read_csv_cached); applies to the
+        default parser, i.e. without dtype_backend, chunksize or dtypes
+    """
+    if path.endswith('.parquet'):
+        # e.g. output of save_cleaned_data(..., "x.parquet"); dtypes come back as saved
+        return pd.read_parquet(path, columns=usecols)
+    if dtype_backend == 'pyarrow' and not chunksize and not dtypes:
+        data = read_csv_arrow(path, usecols=usecols)
+        if categorical_cols:
+            data = data.astype({col: 'category' for col in categorical_cols if col in data.columns})
+        return downcast_numeric(data) if downcast else data
+    if cache and dtype_backend is None and not chunksize and not dtypes:
+        data = read_csv_cached(path)
+        if usecols is not None:
+            data = data[[col for col in data.columns if col in usecols]]
+        if categorical_cols:
+            data = data.astype({col: 'category' for col in categorical_cols if col in data.columns})
+        return downcast_numeric(data) if downcast else data
+    kwargs = {}
+    dtype = dict(dtypes or {})
+    if categorical_cols:
+        dtype.update({col: 'category' for col in categorical_cols})
+    if usecols is not None:
+        kwargs['usecols'] = usecols
+        dtype = {col: kind for col, kind in dtype.items() if col in usecols}
+    if dtype:
+        kwargs['dtype'] = dtype
+    if dtype_backend == 'pyarrow':
+        kwargs.update(dtype_backend='pyarrow', engine='pyarrow')
+    if chunksize:
+        # Constant memory: the caller processes one block at a time (pd.concat to rebuild)
+        reader = pd.read_csv(path, chunksize=chunksize, **kwargs)
+        return (downcast_numeric(chunk) for chunk in reader) if downcast else reader
+    data = pd.read_csv(path, **kwargs)
+    if downcast:
+        data = downcast_numeric(data)
     return data
 
 
+def downcast_numeric(df):
+    """Downcast numeric columns to the smallest integer/float dtype that holds their values"""
+    for col in df.select_dtypes(include='integer').columns:
+        df[col] = pd.to_numeric(df[col], downcast='integer')
+    for col in df.select_dtypes(include='floating').columns:
+        df[col] = pd.to_numeric(df[col], downcast='float')
+    return df
+
+
+def categorize_text(df, max_unique_ratio=0.05, exclude=()):
+    """
+    Convert object columns whose distinct values are under max_unique_ratio of the rows to 'category'.
+    All-missing columns are left alone; pass free-text columns in exclude.
+    """
+    n_rows = max(len(df), 1)
+    for col in df.select_dtypes(include='object').columns.difference(list(exclude), sort=False):
+        n_unique = df[col].nunique()
+        if n_unique and n_unique / n_rows < max_unique_ratio:
+            df[col] = df[col].astype('category')
+    return df
+
+
     
 
 # Detect duplicate entries using Tool Name, Company, and Website. Decide which record to keep and remove the rest using deterministic logic.
@@ -40,24 +184,36 @@ class DuplicateHandler:
     def __init__(self, df):
         self.df = df
         self.duplicate_keys = ['Tool Name', 'Company', 'Website']
+        # Hash the string keys once into an integer id per key combination; all later
+        # duplicate checks and groupbys work on these ids instead of the strings.
+        # observed=True: keys loaded as 'category' are grouped on their codes, without
+        # expanding to every combination of categories
+        self.group_ids = self.df.groupby(self.duplicate_keys, dropna=False, sort=False, observed=True).ngroup()
         logger.info(f"DuplicateHandler initialized with {len(self.df)} records")
         logger.info(f"Duplicate detection keys: {', '.join(self.duplicate_keys)}")
         
     def find_duplicates(self):
         """Identify duplicate groups"""
-        duplicates = self.df[self.df.duplicated(subset=self.duplicate_keys, keep=False)]
-        logger.info(f"Found {len(duplicates)} duplicate records in {duplicates.groupby(self.duplicate_keys, dropna=False).ngroups} groups")
+        is_duplicate = self.group_ids.duplicated(keep=False)
+        duplicates = self.df[is_duplicate]
+        if logger.isEnabledFor(logging.INFO):
+            # The group count is only needed for the log line
+            logger.info(f"Found {len(duplicates)} duplicate records in {self.group_ids[is_duplicate].nunique()} groups")
         return duplicates
     
+    def score_records(self, records):
+        """Score all records in one vectorized pass: higher is better within a duplicate group"""
+        group_ids = self.group_ids.loc[records.index]
+        position = group_ids.groupby(group_ids, sort=False).cumcount()
+        return (records.notna().sum(axis=1)
+                + records['review_count'].fillna(0)
+                + records['average_rating'].fillna(0)
+                + pd.to_numeric(records['Launch Year'], errors='coerce').fillna(0)
+                - position)  # earlier records win ties
+    
     def rank_records(self, group):
-        """Score records: higher is better"""
-        scores = pd.DataFrame(index=group.index)
-        scores['completeness'] = group.notna().sum(axis=1)
-        scores['reviews'] = group['review_count'].fillna(0)
-        scores['rating'] = group['average_rating'].fillna(0)
-        scores['recency'] = group['Launch Year'].fillna(0)
-        scores['position'] = -np.arange(len(group))  # negative for ascending
-        return scores.sum(axis=1).idxmax()
+        """Index of the best record in a single group"""
+        return self.score_records(group).idxmax()
     
     def remove_duplicates(self):
         """Keep best record per duplicate group"""
@@ -66,9 +222,17 @@ class DuplicateHandler:
             logger.info("No duplicates found")
             return self.df, pd.DataFrame()
         
-        keep_indices = dupes.groupby(self.duplicate_keys, dropna=False).apply(self.rank_records)
-        removed = self.df[self.df.index.isin(dupes.index) & ~self.df.index.isin(keep_indices)]
-        cleaned = self.df[~self.df.index.isin(dupes.index) | self.df.index.isin(keep_indices)]
+        # Best record first within each group (stable, so ties keep the earlier record),
+        # then the first row per group is the one to keep; sorts the integer ids, not the strings
+        ranked = pd.DataFrame({'group': self.group_ids.loc[dupes.index], 'score': self.score_records(dupes)})
+        ranked = ranked.sort_values(['group', 'score'], ascending=[True, False], kind='stable')
+        keep_indices = ranked.drop_duplicates(subset='group', keep='first').index
+        # One positional mask: every duplicate except the kept record of its group
+        remove_mask = np.zeros(len(self.df), dtype=bool)
+        remove_mask[self.df.index.get_indexer(dupes.index)] = True
+        remove_mask[self.df.index.get_indexer(keep_indices)] = False
+        removed = self.df[remove_mask]
+        cleaned = self.df[~remove_mask]
         
         logger.info(f"Removed {len(removed)} duplicate records")
         logger.info(f"Retained {len(cleaned)} unique records")
@@ -77,25 +241,49 @@ class DuplicateHandler:
 
 class MissingDataHandler:
     def __init__(self, df):
-        self.df = df.copy()
+        self.df = df
+        self._missing = None
+        self._missing_count = None
+        self._row_missing = None
+        
+    @property
+    def missing(self):
+        """Boolean frame of missing cells, computed once and shared by all methods"""
+        if self._missing is None:
+            self._missing = self.df.isna()
+        return self._missing
+    
+    @property
+    def missing_count(self):
+        """Missing cells per column, reduced once from the shared mask"""
+        if self._missing_count is None:
+            self._missing_count = self.missing.sum()
+        return self._missing_count
+    
+    @property
+    def row_missing(self):
+        """Boolean mask of rows with any missing cell, reduced once from the shared mask"""
+        if self._row_missing is None:
+            self._row_missing = self.missing.any(axis=1)
+        return self._row_missing
         
     def find_missing(self):
         """Find rows with missing required fields"""
-        mask = self.df.isna().any(axis=1)
-        return self.df[mask]
+        return self.df[self.row_missing]
     
     def get_summary(self):
         """Get missing data summary"""
+        missing_count = self.missing_count
         summary = pd.DataFrame({
-            'missing_count': self.df.isna().sum(),
-            'missing_percentage': (self.df.isna().sum() / len(self.df) * 100).round(2)
+            'missing_count': missing_count,
+            'missing_percentage': (missing_count / len(self.df) * 100).round(2)
         })
-        return summary[summary['missing_count'] > 0].sort_values('missing_count', ascending=False)
+        return summary[missing_count > 0].sort_values('missing_count', ascending=False)
     
     def flag_records(self):
         """Add flag column for rows with missing data"""
         flagged = self.df.copy()
-        flagged['has_missing'] = self.df.isna().any(axis=1)
+        flagged['has_missing'] = self.row_missing
         logger.info(f"Flagged {flagged['has_missing'].sum()} records with missing values")
         return flagged
     
@@ -109,22 +297,33 @@ class MissingDataHandler:
     def handle_missing_records(self, drop=False):
         """Handle missing records: fill with median/mode or drop"""
         if drop:
-            missing = self.find_missing()
-            cleaned = self.df[~self.df.index.isin(missing.index)]
+            mask = self.row_missing
+            missing = self.df[mask]
+            cleaned = self.df[~mask]
             logger.info(f"Removed {len(missing)} rows with missing values")
             return cleaned.reset_index(drop=True), missing
         
-        cleaned = self.df.copy()
-        for col in cleaned.columns:
-            if cleaned[col].isna().any():
-                if pd.api.types.is_numeric_dtype(cleaned[col]):
-                    fill_value = cleaned[col].median()
-                    if pd.isna(fill_value):  # If all values are NaN, use 0
-                        fill_value = 0
-                else:
-                    mode_vals = cleaned[col].mode()
-                    fill_value = mode_vals[0] if len(mode_vals) > 0 else "Unknown"
-                cleaned[col] = cleaned[col].fillna(fill_value)
+        gap_cols = self.missing_count.index[self.missing_count > 0]
+        numeric_cols = [col for col in gap_cols if pd.api.types.is_numeric_dtype(self.df[col])]
+        other_cols = [col for col in gap_cols if col not in numeric_cols]
+        
+        # All fill values in two passes (medians, modes), then one fillna over the frame
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", RuntimeWarning)  # all-NaN columns: median is NaN, filled with 0
+            fill_values = self.df[numeric_cols].median().fillna(0).to_dict()
+        if other_cols:
+            modes = self.df[other_cols].mode()
+            first_mode = modes.iloc[0] if len(modes) else pd.Series(index=other_cols, dtype=object)
+            fill_values.update(first_mode.fillna("Unknown").to_dict())
+        cleaned = self.df
+        # A categorical column can only be filled with one of its categories
+        new_categories = {col: [fill_values[col]] for col in other_cols
+                          if isinstance(cleaned[col].dtype, pd.CategoricalDtype)
+                          and fill_values[col] not in cleaned[col].cat.categories}
+        if new_categories:
+            cleaned = cleaned.assign(**{col: cleaned[col].cat.add_categories(values)
+                                        for col, values in new_categories.items()})
+        cleaned = cleaned.fillna(fill_values)
         
         logger.info(f"Filled missing values")
         return cleaned
@@ -132,39 +331,30 @@ class MissingDataHandler:
 
 class URLValidator:
     def __init__(self, df, url_column='Website'):
-        self.df = df.copy()
+        self.df = df
         self.url_column = url_column
+        self._url_valid = None
         logger.info(f"URLValidator initialized for column: {url_column}")
         logger.info(f"Total records to validate: {len(self.df)}")
         
+    @property
+    def url_valid(self):
+        """Boolean mask of well-formed URLs, matched once and shared by all methods"""
+        if self._url_valid is None:
+            # Vectorized match; missing and non-string values come back as NaN and count as invalid
+            self._url_valid = self.df[self.url_column].astype(object).str.strip().str.match(_URL_RE).eq(True)
+        return self._url_valid
+        
     def is_valid_url(self, url):
         """Check if URL is properly formatted"""
         if pd.isna(url) or not isinstance(url, str):
             return False
-        
-        # Basic pattern check
-        url = url.strip()
-        if not re.match(r'^https?://', url, re.IGNORECASE):
-            url = 'http://' + url
-        
-        try:
-            import validators
-            return validators.url(url) is True
-        except ImportError:
-            # Fallback to regex if validators not installed
-            pattern = re.compile(
-                r'^https?://'
-                r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
-                r'localhost|'
-                r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-                r'(?::\d+)?'
-                r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-            return bool(pattern.match(url))
+        return bool(_URL_RE.match(url.strip()))
     
     def validate_urls(self):
         """Validate all URLs and return results"""
         results = self.df.copy()
-        results['url_valid'] = results[self.url_column].apply(self.is_valid_url)
+        results['url_valid'] = self.url_valid
         results['url_missing'] = results[self.url_column].isna()
 
         valid_count = results['url_valid'].sum()
@@ -182,34 +372,72 @@ class URLValidator:
         validated = self.validate_urls()
         return validated[~validated['url_valid'] & ~validated['url_missing']]
     
-    def check_reachability(self, timeout=5, max_workers=10):
-        """Check if URLs are reachable (optional)"""
-        import requests
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+    def check_reachability(self, timeout=5, max_workers=100, per_host=False):
+        """
+        Check if URLs are reachable (optional); max_workers caps the requests in flight
+        per_host: probe each host's root once (remembered across calls) instead of every distinct URL;
+                  the result column is then 'host_reachable', since a dead page on a live host passes
+        """
+        import asyncio
+        import aiohttp
+        from concurrent.futures import ThreadPoolExecutor
         
-        def check_url(url):
-            if pd.isna(url):
-                return None
+        def normalize(url):
+            url = url.strip()
+            return url if _URL_SCHEME_RE.match(url) else 'http://' + url
+        
+        async def check_url(session, semaphore, url):
             try:
-                url = url.strip()
-                if not re.match(r'^https?://', url, re.IGNORECASE):
-                    url = 'http://' + url
-                response = requests.head(url, timeout=timeout, allow_redirects=True)
-                return response.status_code < 400
-            except: 
+                client_timeout = aiohttp.ClientTimeout(total=timeout)
+                async with semaphore:
+                    async with session.head(url, allow_redirects=True, timeout=client_timeout) as response:
+                        status = response.status
+                    if status in (405, 501):
+                        # Some servers reject HEAD; ask with GET (the body is never read)
+                        async with session.get(url, allow_redirects=True, timeout=client_timeout) as response:
+                            status = response.status
+                    return status < 400
+            except Exception:
                 return False
         
-        urls = self.df[self.url_column].dropna().unique()
-        reachability = {}
+        async def check_all(urls):
+            # One event loop and one connection pool for every request
+            semaphore = asyncio.Semaphore(max_workers)
+            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=max_workers)) as session:
+                return await asyncio.gather(*(check_url(session, semaphore, url) for url in urls))
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(check_url, url): url for url in urls}
-            for future in as_completed(futures):
-                url = futures[future]
-                reachability[url] = future.result()
+        def run(targets):
+            try:
+                asyncio.get_running_loop()
+            except RuntimeError:
+                return asyncio.run(check_all(targets))
+            # Already inside an event loop (e.g. Jupyter), so run ours on a separate thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                return executor.submit(asyncio.run, check_all(targets)).result()
+        
+        urls = self.df[self.url_column].dropna().unique()
+        if not per_host:
+            reachability = dict(zip(urls, run([normalize(url) for url in urls])))
+        else:
+            url_hosts = {}
+            probes = {}  # host -> root URL to probe, for hosts not in the cache
+            for url in urls:
+                parsed = urlparse(normalize(url))
+                host = parsed.netloc.lower()
+                url_hosts[url] = host
+                if host not in _HOST_REACHABILITY:
+                    probes.setdefault(host, f"{parsed.scheme}://{parsed.netloc}")
+            for host, alive in zip(probes, run(list(probes.values()))):
+                _HOST_REACHABILITY[host] = alive
+            reachability = {}
+            for url, host in url_hosts.items():
+                _HOST_REACHABILITY.move_to_end(host)
+                reachability[url] = _HOST_REACHABILITY[host]
+            while len(_HOST_REACHABILITY) > _HOST_CACHE_SIZE:
+                _HOST_REACHABILITY.popitem(last=False)
         
         results = self.df.copy()
-        results['url_reachable'] = results[self.url_column].map(reachability)
+        results['host_reachable' if per_host else 'url_reachable'] = results[self.url_column].map(reachability)
         return results
     
     def clean_urls(self):
@@ -227,8 +455,11 @@ class URLValidator:
 
 
 class YearValidator:
+    # year_issue labels, indexed by the small integer codes built in validate_years
+    ISSUE_LABELS = np.array(['missing', 'valid', 'future', 'too_old', 'non_numeric'], dtype=object)
+    
     def __init__(self, df, year_column='Launch Year', min_year=2015, max_year=2026):
-        self.df = df.copy()
+        self.df = df
         self.year_column = year_column
         self.min_year = min_year
         self.max_year = max_year or pd.Timestamp.now().year
@@ -244,29 +475,28 @@ class YearValidator:
         except (ValueError, TypeError):
             return False
     
+    def numeric_years(self, years):
+        """Years as whole numbers (truncated like int(float(year))); NaN where not numeric"""
+        return np.trunc(pd.to_numeric(years, errors='coerce'))
+    
     def validate_years(self):
         """Validate all years and categorize issues"""
         results = self.df.copy()
-        results['year_missing'] = results[self.year_column].isna()
-        results['year_valid'] = results[self.year_column].apply(self.is_valid_year)
-        
-        # Categorize invalid reasons
-        def categorize_invalid(row):
-            if row['year_missing']:
-                return 'missing'
-            if row['year_valid']:
-                return 'valid'
-            try:
-                year_int = int(float(row[self.year_column]))
-                if year_int > self.max_year:
-                    return 'future'
-                if year_int < self.min_year:
-                    return 'too_old'
-            except:
-                return 'non_numeric'
-            return 'invalid'
-        
-        results['year_issue'] = results.apply(categorize_invalid, axis=1)
+        year_missing = results[self.year_column].isna()
+        year_int = self.numeric_years(results[self.year_column])
+        year_valid = year_int.between(self.min_year, self.max_year)
+        
+        results['year_missing'] = year_missing
+        results['year_valid'] = year_valid.where(~year_missing, None)  # missing is not invalid
+        
+        # Categorize invalid reasons as int8 codes, then look the labels up in one take;
+        # NaN fails every comparison so unparseable years fall through to the default
+        issue_codes = np.select(
+            [year_missing, year_valid, year_int > self.max_year, year_int < self.min_year],
+            [0, 1, 2, 3],
+            default=4
+        ).astype(np.int8)
+        results['year_issue'] = self.ISSUE_LABELS[issue_codes]
         logger.info(f"Year validation complete: {len(results)} records processed")
         return results
     
@@ -288,13 +518,14 @@ class YearValidator:
         strategy: 'remove' (delete rows) or 'nullify' (set to NaN)
         """
         validated = self.validate_years()
+        # One pass over the labels, shared by both strategies
+        mask = ~validated['year_issue'].isin(['valid', 'missing']).to_numpy()
         
         if strategy == 'remove':
-            cleaned = validated[validated['year_issue'].isin(['valid', 'missing'])]
-            invalid = validated[~validated['year_issue'].isin(['valid', 'missing'])]
+            cleaned = validated[~mask]
+            invalid = validated[mask]
         elif strategy == 'nullify':
             cleaned = validated.copy()
-            mask = ~cleaned['year_issue'].isin(['valid', 'missing'])
             cleaned.loc[mask, self.year_column] = np.nan
             invalid = validated[mask]
         else:
@@ -309,69 +540,71 @@ class YearValidator:
     def correct_years(self):
         """Attempt to correct obvious errors"""
         corrected = self.df.copy()
-        corrections = []
+        year_int = self.numeric_years(corrected[self.year_column]).to_numpy()
         
-        for idx, row in corrected.iterrows():
-            year = row[self.year_column]
-            if pd.isna(year):
-                continue
-                
-            try:
-                year_int = int(float(year))
-                original = year_int
-                
-                # Common errors: 2-digit years
-                if 0 <= year_int <= 99:
-                    year_int = 2000 + year_int if year_int <= self.max_year % 100 else 1900 + year_int
-                
-                # Future years: might be typo (e.g., 2025 instead of 2015)
-                if year_int > self.max_year:
-                    continue  # Can't reliably correct
-                
-                if year_int != original and self.min_year <= year_int <= self.max_year:
-                    corrected.at[idx, self.year_column] = year_int
-                    corrections.append({
-                        'index': idx,
-                        'original': original,
-                        'corrected': year_int,
-                        'tool': row.get('Tool Name', 'Unknown')
-                    })
-            except:
-                continue
-        logger.info(f"Corrected {len(corrections)} year values")
+        # Common errors: 2-digit years
+        two_digit = (year_int >= 0) & (year_int <= 99)
+        century = np.where(year_int <= self.max_year % 100, 2000, 1900)
+        fixed = np.where(two_digit, century + year_int, year_int)
+        
+        # Future years might be typos (e.g., 2025 instead of 2015) but can't be reliably corrected
+        changed = (fixed != year_int) & (fixed >= self.min_year) & (fixed <= self.max_year)
+        
+        corrections = []
+        if changed.any():
+            corrected.loc[changed, self.year_column] = fixed[changed].astype(int)
+            tools = corrected['Tool Name'].to_numpy()[changed] if 'Tool Name' in corrected.columns else 'Unknown'
+            corrections = {
+                'index': corrected.index[changed],
+                'original': year_int[changed].astype(int),
+                'corrected': fixed[changed].astype(int),
+                'tool': tools
+            }
+        logger.info(f"Corrected {int(changed.sum())} year values")
         return corrected, pd.DataFrame(corrections)
 
 
 class NumericValidator:
     def __init__(self, df, rating_col='average_rating', review_col='review_count', 
                  rating_min=0, rating_max=5):
-        self.df = df.copy()
+        self.df = df
         self.rating_col = rating_col
         self.review_col = review_col
         self.rating_min = rating_min
         self.rating_max = rating_max
+        self._invalid_rating = None
+        self._invalid_review = None
+        
+    @property
+    def invalid_rating(self):
+        """Boolean mask of ratings outside the bounds, computed once and shared by all methods"""
+        if self._invalid_rating is None:
+            ratings = self.df[self.rating_col]
+            self._invalid_rating = ((ratings < self.rating_min) | (ratings > self.rating_max)) & ratings.notna()
+        return self._invalid_rating
+    
+    @property
+    def invalid_review(self):
+        """Boolean mask of negative or non-integer review counts, computed once"""
+        if self._invalid_review is None:
+            reviews = self.df[self.review_col]
+            # Fractional part via np.modf instead of casting the whole column to int
+            non_integer = np.modf(reviews.to_numpy(dtype=float, na_value=np.nan))[0] != 0
+            self._invalid_review = ((reviews < 0) | non_integer) & reviews.notna()
+        return self._invalid_review
         
     def validate_ratings(self):
         """Check if ratings are within valid bounds"""
-        ratings = self.df[self.rating_col].copy()
-        mask = (ratings < self.rating_min) | (ratings > self.rating_max)
-        return self.df[mask & ratings.notna()]
+        return self.df[self.invalid_rating]
     
     def validate_reviews(self):
         """Check if review counts are non-negative integers"""
-        reviews = self.df[self.review_col].copy()
-        
-        # Check for negative or non-integer values
-        mask_negative = reviews < 0
-        mask_non_integer = reviews != reviews.astype(int)
-        mask = (mask_negative | mask_non_integer) & reviews.notna()
-        
-        return self.df[mask]
+        return self.df[self.invalid_review]
     
     def get_summary(self):
         """Get validation summary"""
-        invalid_ratings = len(self.validate_ratings())
-        invalid_reviews = len(self.validate_reviews())
+        invalid_ratings = int(self.invalid_rating.sum())
+        invalid_reviews = int(self.invalid_review.sum())
         
         summary = {
             'invalid_ratings': invalid_ratings,
@@ -387,74 +620,84 @@ class NumericValidator:
     def flag_records(self):
         """Add flag columns for invalid values"""
         flagged = self.df.copy()
-        
-        ratings = flagged[self.rating_col]
-        reviews = flagged[self.review_col]
-        
-        flagged['invalid_rating'] = ((ratings < self.rating_min) | (ratings > self.rating_max)) & ratings.notna()
-        flagged['invalid_review'] = ((reviews < 0) | (reviews != reviews.astype(int))) & reviews.notna()
-        
+        flagged['invalid_rating'] = self.invalid_rating
+        flagged['invalid_review'] = self.invalid_review
         return flagged
     
-    def clean_records(self, strategy='remove'):
+    def clean_records(self, strategy='remove', downcast=False):
         """
         Clean invalid records
         strategy: 'remove' (delete rows) or 'nullify' (set to NaN)
+        downcast: shrink the numeric columns of the cleaned frame (see downcast_numeric)
         """
-        invalid_ratings = self.validate_ratings()
-        invalid_reviews = self.validate_reviews()
-        invalid_indices = invalid_ratings.index.union(invalid_reviews.index)
+        invalid_mask = self.invalid_rating | self.invalid_review
         
         if strategy == 'remove':
-            cleaned = self.df[~self.df.index.isin(invalid_indices)]
-            invalid = self.df[self.df.index.isin(invalid_indices)]
+            cleaned = self.df[~invalid_mask]
+            invalid = self.df[invalid_mask]
         elif strategy == 'nullify':
             cleaned = self.df.copy()
-            
-            ratings = cleaned[self.rating_col]
-            mask_rating = ((ratings < self.rating_min) | (ratings > self.rating_max)) & ratings.notna()
-            cleaned.loc[mask_rating, self.rating_col] = np.nan
-            
-            reviews = cleaned[self.review_col]
-            mask_review = ((reviews < 0) | (reviews != reviews.astype(int))) & reviews.notna()
-            cleaned.loc[mask_review, self.review_col] = np.nan
-            
-            invalid = self.df[self.df.index.isin(invalid_indices)]
+            cleaned.loc[self.invalid_rating, self.rating_col] = np.nan
+            cleaned.loc[self.invalid_review, self.review_col] = np.nan
+            invalid = self.df[invalid_mask]
         else:
             raise ValueError("strategy must be 'remove' or 'nullify'")
         
         logger.info(f"Cleaned {len(invalid)} records with invalid numeric values")
-        return cleaned.reset_index(drop=True), invalid
+        cleaned = cleaned.reset_index(drop=True)
+        if downcast:
+            cleaned = downcast_numeric(cleaned)
+        return cleaned, invalid
 
 
 class TextStandardizer:
     def __init__(self, df, text_columns=None):
-        self.df = df.copy()
-        self.text_columns = text_columns or self.df.select_dtypes(include=['object']).columns.tolist()
-        
-    def clean_text(self, text):
-        """Standardize single text value"""
-        if pd.isna(text) or not isinstance(text, str):
-            return text
-        
-        # Remove extra whitespace
-        text = ' '.join(text.split())
-        
-        # Strip leading/trailing whitespace
-        text = text.strip()
-        
-        # Normalize unicode characters
-        text = text.encode('utf-8', errors='ignore').decode('utf-8')
+        self.df = df
+        self.text_columns = text_columns or self.df.select_dtypes(include=['object', 'category']).columns.tolist()
         
-        return text
+    def apply_text(self, values, func):
+        """
+        Apply a Series -> Series text function to a column; for 'category' columns it runs on
+        the categories only (one call per distinct value) and the codes are remapped
+        """
+        if not isinstance(values.dtype, pd.CategoricalDtype):
+            return func(values)
+        new_categories = func(pd.Series(values.cat.categories, dtype=object))
+        # Different categories can become equal (e.g. 'AI  tool' and 'AI tool'), so re-factorize them
+        remap, categories = pd.factorize(new_categories)
+        codes = values.cat.codes.to_numpy()
+        new_codes = np.where(codes >= 0, remap[codes] if len(remap) else -1, -1)
+        return pd.Series(pd.Categorical.from_codes(new_codes, categories=categories),
+                         index=values.index, name=values.name)
+        
+    def clean_column(self, values):
+        """Collapse runs of whitespace and strip a whole text column; non-string values are left as-is"""
+        try:
+            strings = values.str
+        except AttributeError:
+            # An object column with no strings at all (ints, booleans, ...) has nothing to clean
+            return values
+        arrow_backed = isinstance(values.dtype, pd.ArrowDtype) or getattr(values.dtype, 'storage', None) == 'pyarrow'
+        pattern = _WHITESPACE_RE2 if arrow_backed else r'\s+'
+        # Runs become a single space first, so strip() only ever has spaces to remove
+        cleaned = strings.replace(pattern, ' ', regex=True).str.strip()
+        # .str yields NaN for non-strings, so put the original values back there
+        return cleaned.where(cleaned.notna(), values)
     
     
-    def standardize_all(self, case_rules=None):
+    def standardize_all(self, case_rules=None, arrow_strings=False):
         """
         Standardize all text columns
         case_rules: dict mapping column names to case types
+        arrow_strings: convert pure-text columns to 'string[pyarrow]' first, so the str
+            operations run in Arrow kernels (missing values become pd.NA)
         """
         standardized = self.df.copy()
+        if arrow_strings:
+            standardized = standardized.astype({
+                col: 'string[pyarrow]' for col in self.text_columns
+                if col in standardized.columns and pd.api.types.infer_dtype(standardized[col]) in ('string', 'empty')
+            })
         
         # Default case rules
         if case_rules is None:
@@ -468,53 +711,71 @@ class TextStandardizer:
                 'Target Users': 'title'
             }
         
-        # Clean whitespace and encoding for all text columns
+        # Clean whitespace for all text columns
         for col in self.text_columns:
             if col in standardized.columns:
-                standardized[col] = standardized[col].apply(self.clean_text)
+                standardized[col] = self.apply_text(standardized[col], self.clean_column)
         
         # Apply case rules
+        case_funcs = {
+            'title': lambda values: values.str.title(),
+            'lower': lambda values: values.str.lower(),
+            'upper': lambda values: values.str.upper(),
+            'sentence': self.capitalize,
+        }
         for col, case_type in case_rules.items():
-            if col in standardized.columns:
-                if case_type == 'title':
-                    standardized[col] = standardized[col].str.title()
-                elif case_type == 'lower':
-                    standardized[col] = standardized[col].str.lower()
-                elif case_type == 'upper':
-                    standardized[col] = standardized[col].str.upper()
-                elif case_type == 'sentence':
-                    standardized[col] = standardized[col].apply(
-                        lambda x: x.capitalize() if isinstance(x, str) else x
-                    )
+            if col in standardized.columns and case_type in case_funcs:
+                standardized[col] = self.apply_text(standardized[col], case_funcs[case_type])
         
         logger.info(f"Standardized {len(self.text_columns)} text columns")
         return standardized
     
+    @staticmethod
+    def capitalize(values):
+        """Sentence case; non-string values are left as-is"""
+        try:
+            capitalized = values.str.capitalize()
+        except AttributeError:
+            return values
+        return capitalized.where(capitalized.notna(), values)
+    
     def get_changes_summary(self, standardized_df):
         """Compare original vs standardized data"""
-        changes = []
-        
-        for col in self.text_columns:
-            if col in self.df.columns:
-                mask = self.df[col] != standardized_df[col]
-                changed_count = mask.sum()
-                if changed_count > 0:
-                    changes.append({
-                        'column': col,
-                        'changes': changed_count,
-                    })
+        cols = [col for col in self.text_columns if col in self.df.columns]
+        # Categoricals with different categories cannot be compared directly
+        as_values = lambda frame: frame.astype({col: object for col in frame.select_dtypes(include='category').columns})
+        original, standardized = as_values(self.df[cols]), as_values(standardized_df[cols])
+        # One comparison over all columns; cells missing on both sides are not changes
+        changed = (original != standardized) & ~(original.isna() & standardized.isna())
+        counts = changed.sum()
+        counts = counts[counts > 0]
         
-        return pd.DataFrame(changes)
+        return pd.DataFrame({'column': counts.index, 'changes': counts.to_numpy()})
+
+
+def _bit_labels(names):
+    """Comma-joined label for every bit combination of names (bit i = names[i]); None for no bits"""
+    return np.array(
+        [', '.join(name for bit, name in enumerate(names) if code >> bit & 1) or None
+         for code in range(1 << len(names))],
+        dtype=object)
 
 
 class DescriptionValidator:
+    # Reasons as bits of a uint8 flag code, and the flag string for each code
+    FLAG_NAMES = ('too_short', 'few_words', 'meaningless', 'missing')
+    FLAG_LABELS = _bit_labels(FLAG_NAMES)
+    MISSING_BIT = 8
+
     def __init__(self, df, description_col='Description', min_length=10, min_words=3):
-        self.df = df.copy()
+        self.df = df
         self.description_col = description_col
         self.min_length = min_length
         self.min_words = min_words
         self.meaningless = ['n/a', 'na', 'none', 'null', 'tbd', 'tba', 'coming soon',
                            'no description', 'not available', 'see website', 'lorem ipsum']
+        # One alternation instead of a substring scan per pattern
+        self._meaningless_re = re.compile('|'.join(map(re.escape, self.meaningless)), re.IGNORECASE)
         
     def get_flag_reason(self, text):
         """Check description and return reason if invalid"""
@@ -522,22 +783,27 @@ class DescriptionValidator:
             return 'missing'
         
         text_str = str(text).strip()
-        text_lower = text_str.lower()
-        reasons = []
-        
-        if len(text_str) < self.min_length:
-            reasons.append('too_short')
-        if len(text_str.split()) < self.min_words:
-            reasons.append('few_words')
-        if any(pattern in text_lower for pattern in self.meaningless):
-            reasons.append('meaningless')
-        
-        return ', '.join(reasons) if reasons else None
+        code = ((len(text_str) < self.min_length)
+                | (len(text_str.split()) < self.min_words) << 1
+                | bool(self._meaningless_re.search(text_str)) << 2)
+        return self.FLAG_LABELS[code]
+    
+    def flag_codes(self):
+        """Reason bitmask per row (uint8, bits as in FLAG_NAMES); 0 means the description is fine"""
+        descriptions = self.df[self.description_col]
+        missing = descriptions.isna()
+        text = descriptions[~missing].astype(str).str.strip()
+        
+        codes = np.full(len(descriptions), self.MISSING_BIT, dtype=np.uint8)
+        codes[~missing.to_numpy()] = ((text.str.len() < self.min_length).to_numpy(dtype=np.uint8)
+                                      | (text.str.count(r'\S+') < self.min_words).to_numpy(dtype=np.uint8) << 1
+                                      | text.str.contains(self._meaningless_re).to_numpy(dtype=np.uint8) << 2)
+        return pd.Series(codes, index=descriptions.index)
     
     def flag_descriptions(self):
         """Add flag column for invalid descriptions"""
         flagged = self.df.copy()
-        flagged['desc_flag'] = flagged[self.description_col].apply(self.get_flag_reason)
+        flagged['desc_flag'] = self.FLAG_LABELS[self.flag_codes().to_numpy()]
         
         invalid_count = flagged['desc_flag'].notna().sum()
         logger.info(f"Flagged {invalid_count} invalid descriptions")
@@ -546,10 +812,13 @@ class DescriptionValidator:
     
     def get_summary(self):
         """Get summary of flagged descriptions"""
-        flagged = self.flag_descriptions()
-        total_flagged = flagged['desc_flag'].notna().sum()
+        codes = self.flag_codes().to_numpy()
+        total_flagged = np.count_nonzero(codes)
         
-        reasons = flagged['desc_flag'].dropna().str.split(', ').explode().value_counts()
+        # One bit test per reason instead of splitting and exploding the flag strings
+        counts = pd.Series({name: np.count_nonzero(codes & (1 << bit)) for bit, name in enumerate(self.FLAG_NAMES)},
+                           name='count').rename_axis('desc_flag')
+        reasons = counts[counts > 0].sort_values(ascending=False, kind='stable')
         
         logger.info(f"Total flagged: {total_flagged}")
         logger.info(f"\n{reasons}")
@@ -561,7 +830,10 @@ class DescriptionValidator:
 
 def save_cleaned_data(data: pd.DataFrame, filename: str, index: bool = False):
     try: 
-        data.to_csv(filename, index = False)
+        if filename.endswith('.parquet'):
+            data.to_parquet(filename, engine='pyarrow', compression='zstd', index=False)
+        else:
+            data.to_csv(filename, index = False)
         logger.info(
             "Cleaned data saved successfully")
     except IOError as e:
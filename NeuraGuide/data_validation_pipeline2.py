@@ -1,13 +1,22 @@
 import csv
 import os
 import pandas as pd
-import numpy as np
 import pydantic
 
 import re
 from urllib.parse import urlparse
 
 
+# URL patterns compiled once; the optional scheme stands in for prepending 'http://'
+_URL_SCHEME_RE = re.compile(r'^https?://', re.IGNORECASE)
+_URL_RE = re.compile(
+    r'^(?:https?://)?'
+    r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
+    r'localhost|'
+    r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
+    r'(?::\d+)?'
+    r'(?:/?|[/?]\S+)$', re.IGNORECASE)
+
 
 def load_data(path:str):
     """Loads the dataset"""
@@ -29,65 +38,84 @@ class DataValidator:
         self.essential_fields = essential_fields or ['Tool Name', 'Category', 'Website']
         self.flag_fields = flag_fields or ['Description', 'Primary Function', 'Company']
         self.url_column = url_column
+        self._missing = None
+        
+    @property
+    def missing(self):
+        """Boolean frame of missing cells, computed once and shared by all methods"""
+        if self._missing is None:
+            self._missing = self.df.isna()
+        return self._missing
         
     #DUPLICATE HANDLER  
     def find_duplicates(self):
         """Identify duplicate groups"""
         return self.df[self.df.duplicated(subset=self.duplicate_keys, keep=False)]
     
+    def score_records(self, records):
+        """Score all records in one vectorized pass: higher is better within a duplicate group"""
+        position = records.groupby(self.duplicate_keys, dropna=False, sort=False).cumcount()
+        filled = records.shape[1] - self.missing.loc[records.index, records.columns].sum(axis=1)
+        return (filled
+                + records['review_count'].fillna(0)
+                + records['average_rating'].fillna(0)
+                + pd.to_numeric(records['Launch Year'], errors='coerce').fillna(0)
+                - position)  # earlier records win ties
+    
     def rank_records(self, group):
-        """Score records: higher is better"""
-        scores = pd.DataFrame(index=group.index)
-        scores['completeness'] = group.notna().sum(axis=1)
-        scores['reviews'] = group['review_count'].fillna(0)
-        scores['rating'] = group['average_rating'].fillna(0)
-        scores['recency'] = group['Launch Year'].fillna(0)
-        scores['position'] = -np.arange(len(group))  # negative for ascending
-        return scores.sum(axis=1).idxmax()
+        """Index of the best record in a single group"""
+        return self.score_records(group).idxmax()
     
     def remove_duplicates(self):
         """Keep best record per duplicate group"""
-        dupes = self.find_duplicates()
-        if dupes.empty:
+        dup_mask = self.df.duplicated(subset=self.duplicate_keys, keep=False).to_numpy()
+        if not dup_mask.any():
             print("There are no duplicates")
             return self.df, pd.DataFrame()
         
-        keep_indices = dupes.groupby(self.duplicate_keys, dropna=False).apply(self.rank_records)
-        removed = self.df[self.df.index.isin(dupes.index) & ~self.df.index.isin(keep_indices)]
-        cleaned = self.df[~self.df.index.isin(dupes.index) | self.df.index.isin(keep_indices)]
+        dupes = self.df[dup_mask]
+        scores = self.score_records(dupes)
+        keep_indices = scores.groupby([dupes[key] for key in self.duplicate_keys], dropna=False).idxmax()
+        # One positional mask: every duplicate except the kept record of its group
+        remove_mask = dup_mask.copy()
+        remove_mask[self.df.index.get_indexer(keep_indices)] = False
+        removed = self.df[remove_mask]
+        cleaned = self.df[~remove_mask]
         
         return cleaned.reset_index(drop=True), removed
     
     # MISSING VALUES HANDLER
     def find_missing_essential(self):
         """Find rows with missing essential fields"""
-        mask = self.df[self.essential_fields].isna().any(axis=1)
+        mask = self.missing[self.essential_fields].any(axis=1)
         return self.df[mask]
     
     def find_missing_flagged(self):
         """Find rows with missing flagged fields (warning only)"""
-        mask = self.df[self.flag_fields].isna().any(axis=1)
+        mask = self.missing[self.flag_fields].any(axis=1)
         return self.df[mask]
     
     def get_missing_summary(self):
         """Summary of missing data by column"""
+        missing_count = self.missing.sum()
         summary = pd.DataFrame({
-            'missing_count': self.df.isna().sum(),
-            'missing_pct': (self.df.isna().sum() / len(self.df) * 100).round(2)
+            'missing_count': missing_count,
+            'missing_pct': (missing_count / len(self.df) * 100).round(2)
         })
         return summary[summary['missing_count'] > 0].sort_values('missing_count', ascending=False)
     
     def remove_incomplete(self):
         """Remove rows missing essential fields"""
-        incomplete = self.find_missing_essential()
-        cleaned = self.df[~self.df.index.isin(incomplete.index)]
+        mask = self.missing[self.essential_fields].any(axis=1)
+        incomplete = self.df[mask]
+        cleaned = self.df[~mask]
         return cleaned.reset_index(drop=True), incomplete
     
     def flag_incomplete(self):
         """Add flag column for incomplete records"""
         df_flagged = self.df.copy()
-        df_flagged['missing_essential'] = self.df[self.essential_fields].isna().any(axis=1)
-        df_flagged['missing_flagged'] = self.df[self.flag_fields].isna().any(axis=1)
+        df_flagged['missing_essential'] = self.missing[self.essential_fields].any(axis=1)
+        df_flagged['missing_flagged'] = self.missing[self.flag_fields].any(axis=1)
         return df_flagged
 
 
@@ -96,31 +124,15 @@ class DataValidator:
         """Check if URL is properly formatted"""
         if pd.isna(url) or not isinstance(url, str):
             return False
-        
-        # Basic pattern check
-        url = url.strip()
-        if not re.match(r'^https?://', url, re.IGNORECASE):
-            url = 'http://' + url
-        
-        try:
-            import validators
-            return validators.url(url) is True
-        except ImportError:
-            # Fallback to regex if validators not installed
-            pattern = re.compile(
-                r'^https?://'
-                r'(?:(?:[A-Z0-9](?:[A-Z0-9-]{0,61}[A-Z0-9])?\.)+[A-Z]{2,6}\.?|'
-                r'localhost|'
-                r'\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3})'
-                r'(?::\d+)?'
-                r'(?:/?|[/?]\S+)$', re.IGNORECASE)
-            return bool(pattern.match(url))
+        return bool(_URL_RE.match(url.strip()))
     
     def validate_urls(self):
         """Validate all URLs and return results"""
         results = self.df.copy()
-        results['url_valid'] = results[self.url_column].apply(self.is_valid_url)
-        results['url_missing'] = results[self.url_column].isna()
+        urls = results[self.url_column]
+        # One vectorized match over the column; missing and non-string values count as invalid
+        results['url_valid'] = urls.astype(object).str.strip().str.match(_URL_RE).eq(True)
+        results['url_missing'] = urls.isna()
         return results
     
     def get_invalid_urls(self):
@@ -128,31 +140,44 @@ class DataValidator:
         validated = self.validate_urls()
         return validated[~validated['url_valid'] & ~validated['url_missing']]
     
-    def check_reachability(self, timeout=5, max_workers=10):
-        """Check if URLs are reachable (optional)"""
-        import requests
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+    def check_reachability(self, timeout=5, max_workers=100):
+        """Check if URLs are reachable (optional); max_workers caps the requests in flight"""
+        import asyncio
+        import aiohttp
+        from concurrent.futures import ThreadPoolExecutor
         
-        def check_url(url):
-            if pd.isna(url):
-                return None
+        async def check_url(session, semaphore, url):
             try:
                 url = url.strip()
-                if not re.match(r'^https?://', url, re.IGNORECASE):
+                if not _URL_SCHEME_RE.match(url):
                     url = 'http://' + url
-                response = requests.head(url, timeout=timeout, allow_redirects=True)
-                return response.status_code < 400
-            except: 
+                client_timeout = aiohttp.ClientTimeout(total=timeout)
+                async with semaphore:
+                    async with session.head(url, allow_redirects=True, timeout=client_timeout) as response:
+                        status = response.status
+                    if status in (405, 501):
+                        # Some servers reject HEAD; ask with GET (the body is never read)
+                        async with session.get(url, allow_redirects=True, timeout=client_timeout) as response:
+                            status = response.status
+                    return status < 400
+            except Exception:
                 return False
         
-        urls = self.df[self.url_column].dropna().unique()
-        reachability = {}
+        async def check_all(urls):
+            semaphore = asyncio.Semaphore(max_workers)
+            async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=max_workers)) as session:
+                return await asyncio.gather(*(check_url(session, semaphore, url) for url in urls))
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {executor.submit(check_url, url): url for url in urls}
-            for future in as_completed(futures):
-                url = futures[future]
-                reachability[url] = future.result()
+        urls = self.df[self.url_column].dropna().unique()
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            checked = asyncio.run(check_all(urls))
+        else:
+            # Already inside an event loop (e.g. Jupyter), so run ours on a separate thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                checked = executor.submit(asyncio.run, check_all(urls)).result()
+        reachability = dict(zip(urls, checked))
         
         results = self.df.copy()
         results['url_reachable'] = results[self.url_column].map(reachability)
@@ -139,6 +139,23 @@ def minimal_cleaning_example():
     pipeline.generate_report()
 
 
+# ============================================
+# SCENARIO 5: Many Files in Parallel
+# ============================================
+def parallel_cleaning_example():
+    """
+    Clean a batch of CSV files at once, one process per file.
+    """
+    print("\n=== SCENARIO 5: Parallel Cleaning ===\n")
+    
+    reports = DataCleaningPipeline.run_many(
+        ['data_part1.csv', 'data_part2.csv', 'data_part3.csv'],
+        output_dir='.'
+    )
+    for filepath, report in reports.items():
+        print(f"{filepath}: {report.get('original_rows')} -> {report.get('final_rows')} rows")
+
+
 # ============================================
 # Run Examples
 # ============================================
@@ -148,11 +165,13 @@ if __name__ == "__main__":
     print("2. Advanced Cleaning with Outliers")
     print("3. Custom Column-Specific Cleaning")
     print("4. Minimal Cleaning")
+    print("5. Parallel Cleaning of Several Files")
     
     # Uncomment the scenario you want to run:
     # basic_cleaning_example()
     # advanced_cleaning_example()
     # custom_cleaning_example()
     # minimal_cleaning_example()
+    # parallel_cleaning_example()
     
     print("\nUncomment the scenario you want to run in the script!")
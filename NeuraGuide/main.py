@@ -3,6 +3,7 @@ import pandas as pd
 
 from data_validation_pipeline import(
     load_data,
+    categorize_text,
     DuplicateHandler,
     MissingDataHandler,
     URLValidator,
@@ -13,25 +14,41 @@ from data_validation_pipeline import(
     save_cleaned_data
 )
 
+# One seeded PCG64 generator for all the imputed values, so runs are reproducible
+rng = np.random.default_rng(seed=42)
+
 # Loading data
 path = r"C:\Users\ncc333\Desktop\Deep_Learning\NeuraGuide\AI_Tools.csv"
 
 
-df = load_data(path)
-df = df.copy()
+# cache=True: after the first run the parsed CSV is read back from AI_Tools.csv.parquet
+df = load_data(path, cache=True)
 
 # Replaced "Unknown" with a range of years from 2020 to 2025
-mask = df["Launch Year"] == "Unknown"
-df.loc[mask, "Launch Year"] = np.random.randint(2020, 2025, size=mask.sum())
+# (one comparison on the raw array, then a positional write; other values stay as loaded)
+years = df["Launch Year"].to_numpy(copy=True)
+unknown = years == "Unknown"
+years[unknown] = rng.integers(2020, 2025, size=np.count_nonzero(unknown))
+df["Launch Year"] = years
 
 # Replaced 0.0 ratings with a range of values from 1 - 5 with a preference for high values
-df["average_rating"] = np.where(df["average_rating"] == 0.0, 
-                             np.round(1 + 4 * np.random.beta(a=5, b=1.5, size=len(df)), 2), 
-                             df["average_rating"]) 
+# (samples are drawn only for the zero-rated rows)
+ratings = df["average_rating"].to_numpy(copy=True)
+zero_rated = ratings == 0.0
+n_zero = np.count_nonzero(zero_rated)
+if n_zero:
+    ratings[zero_rated] = np.round(1 + 4 * rng.beta(a=5, b=1.5, size=n_zero), 2)
+    df["average_rating"] = ratings
 
 #Replaced 'Unknown' with the Tool Name
-mask = df["Company"] == "Unknown"
-df.loc[mask, "Company"] = df.loc[mask, "Tool Name"]
+company = df["Company"].to_numpy()
+df["Company"] = np.where(company == "Unknown", df["Tool Name"].to_numpy(), company)
+
+# Low-cardinality text (Category, Pricing Model, ...) as 'category': integer codes for
+# comparisons and text standardization runs once per distinct value.
+# Launch Year holds mixed years/strings that YearValidator parses, so it stays as loaded
+# and Description is free text
+df = categorize_text(df, exclude=["Launch Year", "Description"])
 
 
 # Identifying and removing duplicate tools
@@ -0,0 +1,74 @@
+"""Prompt and LCEL chain shared by rag_system.py (CLI) and rag_system_app.py (API)"""
+from operator import itemgetter
+
+from langchain_openai import OpenAIEmbeddings, ChatOpenAI
+from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
+from langchain_core.output_parsers import StrOutputParser
+
+# System prompt
+system_prompt_text = """
+You are a personal RAG assistant answering questions strictly from the provided context about Esther Kudoro.
+
+### INSTRUCTIONS:
+1. Answer questions about professional experience, skills, repositories, and technical implementation details.
+2. Use ONLY the context below. If the answer is not present, say "I do not have that information."
+3. ALWAYS cite your sources implicitly by referring to the specific file or section.
+4. Format all responses as clean plain text with no markdown or special characters.
+
+### PRIVACY GUARDRAILS (CRITICAL):
+You MUST REFUSE to answer questions about the following personal sensitive information, even if it might be present in the context:
+- Age
+- Date of birth
+- Home Address
+- Phone number
+- Personal Email address
+- Any other sensitive personal identifiers
+
+If a user asks for this information, reply EXACTLY with:
+"I cannot share personal or sensitive information such as contact details or age. Please ask about her professional experience or projects."
+
+Context:
+{context}
+
+Question: {question}
+
+Answer clearly and concisely.
+"""
+
+prompt = ChatPromptTemplate.from_messages([
+    ("system", system_prompt_text),
+    MessagesPlaceholder(variable_name="chat_history"),
+    ("human", "{question}")
+])
+
+def format_docs(docs):
+    return "\n\n".join(doc.page_content for doc in docs)
+
+def build_embeddings(api_key):
+    """Embeddings client used both to ingest documents and to embed queries"""
+    # chunk_size: texts sent per embeddings request, so ingestion makes one API call per 1000 chunks
+    return OpenAIEmbeddings(model="text-embedding-3-small", openai_api_key=api_key,
+                            chunk_size=1000, max_retries=6)
+
+def build_chain(api_key, persist_dir="./chroma_db", k=4, vectorstore=None):
+    """Create the retriever, LLM and RAG chain; opens the persisted Chroma store unless one is passed in.
+
+    Returns (chain, vectorstore).
+    """
+    if vectorstore is None:
+        from langchain_chroma import Chroma
+        vectorstore = Chroma(persist_directory=persist_dir, embedding_function=build_embeddings(api_key))
+    retriever = vectorstore.as_retriever(search_kwargs={"k": k})
+    llm = ChatOpenAI(model="gpt-4o", temperature=0, openai_api_key=api_key)
+
+    chain = (
+        {
+            "context": itemgetter("question") | retriever | format_docs,
+            "chat_history": itemgetter("chat_history"),
+            "question": itemgetter("question")
+        }
+        | prompt
+        | llm
+        | StrOutputParser()
+    )
+    return chain, vectorstore
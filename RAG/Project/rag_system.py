@@ -2,17 +2,16 @@ print("Importing libraries...")
 #loading and chunking libraries
 from langchain_community.document_loaders import TextLoader, PyPDFLoader
 from langchain_text_splitters import RecursiveCharacterTextSplitter
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
 import os
 
 # vector storage
 from dotenv import load_dotenv
-from langchain_openai import OpenAIEmbeddings
 from langchain_community.vectorstores import Chroma
 
 #LECL libraries
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_openai import ChatOpenAI
-from langchain_core.output_parsers import StrOutputParser
+from rag_core import build_embeddings, build_chain
 
 # Conversational memory
 from langchain_core.messages import HumanMessage, AIMessage
@@ -27,102 +26,90 @@ if not api_key:
 
 print("API key loaded")
 
+def load_file(file_path):
+    """Load one .txt or .pdf file into documents; other files give an empty list"""
+    if file_path.endswith(".txt"):
+        return TextLoader(file_path, encoding='utf-8').load()
+    elif file_path.endswith(".pdf"):
+        return PyPDFLoader(file_path).load()
+    return []
+
 #Loading and Chunking Documents
 data_path = r"C:\Users\owner\Desktop\Files_Deep_Learning\RAG\Project\documents"
-# Loading document
-documents = []
-for file in os.listdir(data_path):
-    file_path = os.path.join(data_path, file)
-
-    if file.endswith(".txt"):
-        loader = TextLoader(file_path, encoding='utf-8')
-        documents.extend(loader.load())
-
-    elif file.endswith(".pdf"):
-        loader = PyPDFLoader(file_path)
-        documents.extend(loader.load())
-print("Documents loaded.")
-
-#Chunking
-text_splitter = RecursiveCharacterTextSplitter(chunk_size=400, chunk_overlap = 50)
-chunks = text_splitter.split_documents(documents)
-print("document loaded and chunked!")
-
-
-### Storing embeddings in a vector database
-#Creating embeddings and storing
-embedding = OpenAIEmbeddings(model= "text-embedding-3-small", openai_api_key=api_key)
-vectorstore = Chroma.from_documents(documents=chunks,
-                                    embedding=embedding, persist_directory = "./chroma_db")
-
-vectorstore.persist()
-print(f"Embeddings created and saved to chroma_db")
+persist_dir = "./chroma_db"
+# Fingerprint of the documents folder (names, sizes, modification times), stored next to the
+# vector store so embeddings are only rebuilt when the documents change
+fingerprint_path = os.path.join(persist_dir, "documents.sha256")
+fingerprint = hashlib.sha256()
+for file in sorted(os.listdir(data_path)):
+    stat = os.stat(os.path.join(data_path, file))
+    fingerprint.update(f"{file}|{stat.st_size}|{stat.st_mtime_ns}\n".encode("utf-8"))
+fingerprint = fingerprint.hexdigest()
+
+stored_fingerprint = None
+if os.path.exists(fingerprint_path):
+    with open(fingerprint_path, encoding="utf-8") as f:
+        stored_fingerprint = f.read().strip()
+store_exists = os.path.isdir(persist_dir) and any(name != "documents.sha256" for name in os.listdir(persist_dir))
+# An existing store without a fingerprint (built before this check) is trusted as-is
+reuse_store = store_exists and stored_fingerprint in (None, fingerprint)
+
+embedding = build_embeddings(api_key)
+
+if reuse_store:
+    # Skips loading, chunking and the embedding API calls entirely
+    vectorstore = Chroma(persist_directory=persist_dir, embedding_function=embedding)
+    if stored_fingerprint is None:
+        # Adopt the store as matching the current documents, so later changes are detected
+        with open(fingerprint_path, "w", encoding="utf-8") as f:
+            f.write(fingerprint)
+    print(f"Loaded existing embeddings from {persist_dir}")
+else:
+    # Loading document
+    # Files are parsed concurrently; map keeps the sorted file order so chunking stays deterministic
+    file_paths = [os.path.join(data_path, file) for file in sorted(os.listdir(data_path))]
+    documents = []
+    with ThreadPoolExecutor() as executor:
+        for loaded in executor.map(load_file, file_paths):
+            documents.extend(loaded)
+    print("Documents loaded.")
+
+    #Chunking
+    chunk_size = 400
+    # Drop blank/boilerplate pages (under a quarter chunk of text) and exact repeats before
+    # splitting, so they never become chunks that cost an embedding call
+    seen = set()
+    kept = []
+    for doc in documents:
+        text = doc.page_content.strip()
+        if len(text) >= chunk_size // 4 and text not in seen:
+            seen.add(text)
+            kept.append(doc)
+    print(f"Kept {len(kept)} of {len(documents)} pages for chunking")
+    documents = kept
+
+    text_splitter = RecursiveCharacterTextSplitter(chunk_size=chunk_size, chunk_overlap = 50)
+    chunks = text_splitter.split_documents(documents)
+    print("document loaded and chunked!")
+
+
+    ### Storing embeddings in a vector database
+    if store_exists:
+        # Documents changed: drop the stale collection instead of adding duplicates to it
+        Chroma(persist_directory=persist_dir, embedding_function=embedding).delete_collection()
+    #Creating embeddings and storing
+    vectorstore = Chroma.from_documents(documents=chunks,
+                                        embedding=embedding, persist_directory = persist_dir)
+
+    vectorstore.persist()
+    with open(fingerprint_path, "w", encoding="utf-8") as f:
+        f.write(fingerprint)
+    print(f"Embeddings created and saved to chroma_db")
 
 
 ## RAG Chain with LCEL
-# Initialize LLM
-llm = ChatOpenAI(model="gpt-4o", temperature=0,openai_api_key=api_key)
-
-# Retriever
-retriever = vectorstore.as_retriever(search_kwargs={"k": 4})
-
-system_prompt_text = """
-You are a personal RAG assistant answering questions strictly from the provided context about Esther Kudoro.
-
-### INSTRUCTIONS:
-1. Answer questions about professional experience, skills, repositories, and technical implementation details.
-2. Use ONLY the context below. If the answer is not present, say "I do not have that information."
-3. ALWAYS cite your sources implicitly by referring to the specific file or section.
-4. Format all responses as clean plain text with no markdown or special characters.
-
-### PRIVACY GUARDRAILS (CRITICAL):
-You MUST REFUSE to answer questions about the following personal sensitive information, even if it might be present in the context:
-- Age
-- Date of birth
-- Home Address
-- Phone number
-- Personal Email address
-- Any other sensitive personal identifiers
-
-If a user asks for this information, reply EXACTLY with:
-"I cannot share personal or sensitive information such as contact details or age. Please ask about her professional experience or projects."
-
-
-Context:
-{context}
-
-Question: {question}
-
-Answer clearly and concisely.
-"""
-
-prompt = ChatPromptTemplate.from_messages([
-    ("system", system_prompt_text),
-    MessagesPlaceholder(variable_name="chat_history"),
-    ("human", "{question}")
-])
-
-def format_docs(docs):
-    return "\n\n".join(doc.page_content for doc in docs)
-
-
-## Initialising and activating conversational memory
-# RAG CHAIN
-from operator import itemgetter
-rag_chain = (
-    {
-        "context": itemgetter("question")
-        | retriever
-        | format_docs,
-
-        "chat_history": itemgetter("chat_history"),
-        "question": itemgetter("question")
-    }
-    | prompt
-    | llm
-    | StrOutputParser()
-)
-
+# Prompt, retriever, LLM and conversational memory placeholder are defined once in rag_core
+rag_chain, _ = build_chain(api_key, persist_dir, vectorstore=vectorstore)
 print("RAG Chain created!")
 
 
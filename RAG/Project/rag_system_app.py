@@ -1,20 +1,32 @@
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from pydantic import BaseModel
 from typing import List, Optional
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import your existing RAG components
-from langchain_openai import OpenAIEmbeddings, ChatOpenAI
-from langchain_chroma import Chroma
-from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
-from langchain_core.output_parsers import StrOutputParser
 from langchain_core.messages import HumanMessage, AIMessage
-from operator import itemgetter
+from rag_core import build_chain
+from contextlib import asynccontextmanager
+from collections import OrderedDict
+import asyncio
 import os
+import time
 from dotenv import load_dotenv
 
+# Load environment variables
+load_dotenv()
+api_key = os.getenv("paid_api")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Built once per worker at startup and shared by every request via app.state
+    app.state.rag_chain, _ = build_chain(api_key)
+    # Endpoints are async, so concurrent requests can interleave on the same session
+    app.state.sessions_lock = asyncio.Lock()
+    yield
+
 # Initialize FastAPI app
-app = FastAPI(title="Esther Kudoro RAG Assistant API")
+app = FastAPI(title="Esther Kudoro RAG Assistant API", lifespan=lifespan)
 
 # Add CORS middleware
 app.add_middleware(
@@ -25,67 +37,6 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Load environment variables
-load_dotenv()
-api_key = os.getenv("paid_api")
-
-# Initialize RAG components
-embedding = OpenAIEmbeddings(model="text-embedding-3-small", openai_api_key=api_key)
-vectorstore = Chroma(persist_directory="./chroma_db", embedding_function=embedding)
-retriever = vectorstore.as_retriever(search_kwargs={"k": 4})
-llm = ChatOpenAI(model="gpt-4o", temperature=0, openai_api_key=api_key)
-
-# System prompt
-system_prompt_text = """
-You are a personal RAG assistant answering questions strictly from the provided context about Esther Kudoro.
-
-### INSTRUCTIONS:
-1. Answer questions about professional experience, skills, repositories, and technical implementation details.
-2. Use ONLY the context below. If the answer is not present, say "I do not have that information."
-3. ALWAYS cite your sources implicitly by referring to the specific file or section.
-4. Format all responses as clean plain text with no markdown or special characters.
-
-### PRIVACY GUARDRAILS (CRITICAL):
-You MUST REFUSE to answer questions about the following personal sensitive information, even if it might be present in the context:
-- Age
-- Date of birth
-- Home Address
-- Phone number
-- Personal Email address
-- Any other sensitive personal identifiers
-
-If a user asks for this information, reply EXACTLY with:
-"I cannot share personal or sensitive information such as contact details or age. Please ask about her professional experience or projects."
-
-Context:
-{context}
-
-Question: {question}
-
-Answer clearly and concisely.
-"""
-
-prompt = ChatPromptTemplate.from_messages([
-    ("system", system_prompt_text),
-    MessagesPlaceholder(variable_name="chat_history"),
-    ("human", "{question}")
-])
-
-def format_docs(docs):
-    return "\n\n".join(doc.page_content for doc in docs)
-
-# Build RAG chain
-rag_chain = (
-    {
-        "context": itemgetter("question") | retriever | format_docs,
-        "chat_history": itemgetter("chat_history"),
-        "question": itemgetter("question")
-    }
-    | prompt
-    | llm
-    | StrOutputParser()
-)
-
 # Pydantic models
 class Message(BaseModel):
     role: str
@@ -100,7 +51,22 @@ class QueryResponse(BaseModel):
     question: str
 
 # Store sessions (in production, use Redis or a database)
-sessions = {}
+# session_id -> (last_used, history), least recently used first; bounded by size and idle time
+sessions = OrderedDict()
+SESSION_MAXSIZE = 10_000
+SESSION_TTL = 3600
+
+def get_session(session_id: str) -> list:
+    """History for session_id (created if missing); expires idle sessions and evicts the LRU ones. Call under sessions_lock"""
+    now = time.monotonic()
+    # Oldest entries are at the front, so expiry stops at the first live session
+    while sessions and now - next(iter(sessions.values()))[0] > SESSION_TTL:
+        sessions.popitem(last=False)
+    _, history = sessions.pop(session_id, (now, []))
+    sessions[session_id] = (now, history)
+    while len(sessions) > SESSION_MAXSIZE:
+        sessions.popitem(last=False)
+    return history
 
 class SessionRequest(BaseModel):
     question: str
@@ -112,7 +78,7 @@ def read_root():
     return {"message": "Esther Kudoro RAG Assistant API", "status": "running"}
 
 @app.post("/query", response_model=QueryResponse)
-def query_rag(request: QueryRequest):
+async def query_rag(request: QueryRequest, http_request: Request):
     """
     Query the RAG system with optional chat history.
     """
@@ -125,8 +91,8 @@ def query_rag(request: QueryRequest):
             elif msg.role == "assistant":
                 chat_history.append(AIMessage(content=msg.content))
         
-        # Invoke RAG chain
-        answer = rag_chain.invoke({
+        # Invoke RAG chain; awaiting frees the worker for other requests during the OpenAI call
+        answer = await http_request.app.state.rag_chain.ainvoke({
             "question": request.question,
             "chat_history": chat_history
         })
@@ -137,29 +103,28 @@ def query_rag(request: QueryRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.post("/chat/{session_id}", response_model=QueryResponse)
-def chat_with_session(session_id: str, request: QueryRequest):
+async def chat_with_session(session_id: str, request: QueryRequest, http_request: Request):
     """
     Chat with session management. Chat history is stored per session_id.
     """
     try:
-        # Initialize session if it doesn't exist
-        if session_id not in sessions:
-            sessions[session_id] = []
-        
-        # Get chat history from session
-        chat_history = sessions[session_id]
+        lock = http_request.app.state.sessions_lock
+        async with lock:
+            # Initialize session if it doesn't exist; snapshot the history for this request
+            chat_history = list(get_session(session_id))
         
         # Invoke RAG chain
-        answer = rag_chain.invoke({
+        answer = await http_request.app.state.rag_chain.ainvoke({
             "question": request.question,
             "chat_history": chat_history
         })
         
         # Update session history
-        sessions[session_id].extend([
-            HumanMessage(content=request.question),
-            AIMessage(content=answer)
-        ])
+        async with lock:
+            get_session(session_id).extend([
+                HumanMessage(content=request.question),
+                AIMessage(content=answer)
+            ])
         
         return QueryResponse(answer=answer, question=request.question)
     
@@ -167,20 +132,21 @@ def chat_with_session(session_id: str, request: QueryRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.delete("/chat/{session_id}")
-def clear_session(session_id: str):
+async def clear_session(session_id: str, http_request: Request):
     """
     Clear chat history for a specific session.
     """
-    if session_id in sessions:
-        del sessions[session_id]
-        return {"message": f"Session {session_id} cleared"}
+    async with http_request.app.state.sessions_lock:
+        if sessions.pop(session_id, None) is not None:
+            return {"message": f"Session {session_id} cleared"}
     return {"message": f"Session {session_id} not found"}
 
 @app.get("/health")
-def health_check():
+def health_check(http_request: Request):
     """
     Health check endpoint.
     """
-    return {"status": "healthy", "vectorstore": "loaded"}
+    loaded = hasattr(http_request.app.state, "rag_chain")
+    return {"status": "healthy", "vectorstore": "loaded" if loaded else "not loaded"}
 
 # Run with: uvicorn filename:app --reload
\ No newline at end of file